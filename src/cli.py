@@ -3,14 +3,21 @@ CLI Entry Point
 """
 
 import argparse
+import logging
+import multiprocessing
+import os
 import sys
 import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from functools import cached_property
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from .ingest.eml_parser import EMLParser
 from .extract.extraction_engine import ExtractionEngine
-from .export.excel import ExcelExporter
+from .export.excel import ExcelExporter, read_template_columns
 from .observability.metrics import MetricsCollector
 from .observability.trace import TraceLogger
 
@@ -21,13 +28,23 @@ class RosterParserCLI:
     def __init__(self):
         self.metrics = MetricsCollector()
         self.trace = TraceLogger()
-        self.parser = EMLParser()
-        self.engine = ExtractionEngine()
-        self.exporter = ExcelExporter()
         
         # Get template path - stored in templates directory
         self.template_path = Path(__file__).parent.parent / "templates" / "Output Format.xlsx"
     
+    # The single-file pipeline is built on first use; batch runs build theirs in _worker_init
+    @cached_property
+    def parser(self) -> EMLParser:
+        return EMLParser()
+    
+    @cached_property
+    def engine(self) -> ExtractionEngine:
+        return ExtractionEngine()
+    
+    @cached_property
+    def exporter(self) -> ExcelExporter:
+        return ExcelExporter()
+    
     def parse_single(self, eml_path: Path, output_path: Path) -> bool:
         """Parse single EML file"""
         start_time = time.time()
@@ -62,50 +79,95 @@ class RosterParserCLI:
             self.trace.log_error(str(e))
             return False
     
-    def parse_batch(self, eml_dir: Path, output_dir: Path, workers: int = 4) -> bool:
-        """Parse multiple EML files in parallel"""
-        eml_files = list(eml_dir.glob("*.eml"))
-        if not eml_files:
+    def parse_batch(self, eml_dir: Path, output_dir: Path, workers: int = 4, force: bool = False) -> bool:
+        """Parse multiple EML files in parallel, skipping files whose output is up to date"""
+        with os.scandir(eml_dir) as entries:
+            eml_entries = sorted(
+                (Path(entry.path), entry.stat().st_mtime) for entry in entries
+                if entry.name.endswith('.eml') and entry.is_file()
+            )
+        if not eml_entries:
             print(f"No .eml files found in {eml_dir}")
             return False
         
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        jobs = []
+        skipped_count = 0
+        for eml_file, eml_mtime in eml_entries:
+            output_file = output_dir / f"{eml_file.stem}_output.xlsx"
+            if not force:
+                try:
+                    if output_file.stat().st_mtime >= eml_mtime:
+                        skipped_count += 1
+                        continue
+                except FileNotFoundError:
+                    pass
+            jobs.append((eml_file, output_file))
+        
+        if skipped_count:
+            print(f"Skipping {skipped_count} files with up-to-date output (use --force to reprocess)")
+        if not jobs:
+            print("All output files are up to date")
+            return True
+        
+        eml_files = [eml_file for eml_file, _ in jobs]
+        
         print(f"Processing {len(eml_files)} files with {workers} workers...")
         batch_start_time = time.time()
         
-        # Process in parallel
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = []
-            for eml_file in eml_files:
-                output_file = output_dir / f"{eml_file.stem}_output.xlsx"
-                future = executor.submit(_batch_worker_function_with_metrics, eml_file, self.template_path, output_file)
-                futures.append((eml_file, future))
-            
-            success_count = 0
-            all_results = []
-            
-            for eml_file, future in futures:
-                try:
-                    result = future.result()
-                    if result['success']:
-                        success_count += 1
-                        # Record metrics from worker
-                        self.metrics.record_processing_time(result['processing_time'])
-                        self.metrics.record_field_success_rates(result['extracted_data'])
-                        self.metrics.record_file_success(True)
-                        
-                        # Record stage timings if available
-                        for stage, timing in result.get('stage_timings', {}).items():
-                            self.metrics.record_stage_time(stage, timing)
-                    else:
-                        self.metrics.record_file_success(False)
-                    
-                    all_results.append(result)
+        # Read the template once for the whole batch instead of once per file
+        template_columns = read_template_columns(self.template_path)
+        
+        chunksize = max(1, len(jobs) // (workers * 4))
+        chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+        
+        # Worker progress lines travel over a queue and are written by a single listener
+        log_queue = multiprocessing.Queue()
+        progress_handler = logging.StreamHandler(sys.stdout)
+        progress_handler.setFormatter(logging.Formatter('%(message)s'))
+        listener = QueueListener(log_queue, progress_handler)
+        listener.start()
+        
+        try:
+            # Process in parallel; each worker builds its pipeline once in _worker_init.
+            # Chunks are consumed as they finish so a slow file does not hold back the rest.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_worker_init,
+                initargs=(self.template_path, template_columns, log_queue)
+            ) as executor:
+                future_to_chunk = {executor.submit(_batch_worker_chunk, chunk): chunk for chunk in chunks}
+                
+                success_count = 0
+                all_results = []
+                
+                for future in as_completed(future_to_chunk):
+                    try:
+                        chunk_results = future.result()
+                    except Exception as e:
+                        for eml_file, _ in future_to_chunk[future]:
+                            print(f"✗ Error processing {eml_file.name}: {str(e)}")
+                            self.metrics.record_file_success(False)
+                        continue
                     
-                except Exception as e:
-                    print(f"✗ Error processing {eml_file.name}: {str(e)}")
-                    self.metrics.record_file_success(False)
+                    for result in chunk_results:
+                        if result['success']:
+                            success_count += 1
+                            # Record metrics from worker
+                            self.metrics.record_processing_time(result['processing_time'])
+                            self.metrics.merge_field_success_summary(result['field_success'])
+                            self.metrics.record_file_success(True)
+                            
+                            # Record stage timings if available
+                            for stage, timing in result.get('stage_timings', {}).items():
+                                self.metrics.record_stage_time(stage, timing)
+                        else:
+                            self.metrics.record_file_success(False)
+                        
+                        all_results.append(result)
+        finally:
+            listener.stop()
         
         batch_duration = time.time() - batch_start_time
         
@@ -147,64 +209,129 @@ class RosterParserCLI:
         print("="*60)
         
         return success_count == len(eml_files)
+
+
+# Per-process pipeline, built once by _worker_init and reused for every file
+_PARSER: Optional[EMLParser] = None
+_ENGINE: Optional[ExtractionEngine] = None
+_EXPORTER: Optional[ExcelExporter] = None
+_TEMPLATE_PATH: Optional[Path] = None
+_METRICS: Optional[MetricsCollector] = None
+
+# Excel writes are I/O bound, so they run on threads while the worker parses the next file
+_EXPORT_POOL: Optional[ThreadPoolExecutor] = None
+_EXPORT_THREADS = 2
+
+# Per-file progress lines from batch workers, forwarded to the parent through a queue
+_progress_logger = logging.getLogger(__name__ + '.progress')
+
+
+def _worker_init(template_path: Path, template_columns: Optional[List[str]] = None, log_queue=None):
+    """Initialize the parser, engine and exporter once per worker process"""
+    global _PARSER, _ENGINE, _EXPORTER, _TEMPLATE_PATH, _METRICS, _EXPORT_POOL
     
-    def _worker_process(self, eml_path: Path, template_path: Path, output_path: Path) -> bool:
-        """Worker process for batch processing"""
-        # Create new instances for each worker to avoid shared state
-        parser = EMLParser()
-        engine = ExtractionEngine()
-        exporter = ExcelExporter()
-        
-        try:
-            parsed_content = parser.parse_eml(eml_path)
-            extracted_data = engine.extract_all_fields(parsed_content)
-            return exporter.export_to_excel(extracted_data, template_path, output_path)
-        except Exception:
-            return False
+    if log_queue is not None:
+        _progress_logger.handlers[:] = [QueueHandler(log_queue)]
+        _progress_logger.setLevel(logging.INFO)
+        _progress_logger.propagate = False
+    
+    _PARSER = EMLParser()
+    _ENGINE = ExtractionEngine()
+    # Batch exports stream through xlsxwriter's constant-memory mode when it is installed
+    _EXPORTER = ExcelExporter(expected_columns=template_columns, engine='xlsxwriter')
+    _TEMPLATE_PATH = template_path
+    _METRICS = MetricsCollector()
+    _EXPORT_POOL = ThreadPoolExecutor(max_workers=_EXPORT_THREADS)
+
+
+def _batch_worker_chunk(jobs: List[Tuple[Path, Path]]) -> List[dict]:
+    """Process a chunk of (eml_path, output_path) jobs in a single task"""
+    results = []
+    # At most _EXPORT_THREADS exports stay in flight; older ones are finished
+    # (and their progress reported) before the next file is parsed
+    pending = deque()
+    for eml_path, output_path in jobs:
+        pending.append(_start_batch_job(eml_path, output_path))
+        if len(pending) > _EXPORT_THREADS:
+            results.append(_finish_batch_job(pending.popleft()))
+    results.extend(_finish_batch_job(job) for job in pending)
+    return results
 
 
-def _batch_worker_function_with_metrics(eml_path: Path, template_path: Path, output_path: Path) -> dict:
-    start_time = time.time()
-    stage_timings = {}
+def _start_batch_job(eml_path: Path, output_path: Path) -> dict:
+    """Parse and extract one file, then hand its export to the export thread pool"""
+    job = {
+        'eml_path': eml_path,
+        'output_path': output_path,
+        'start_time': time.time(),
+        'stage_timings': {},
+        'field_success': {},
+        'export_future': None,
+        'error': None
+    }
     
     try:
-        parser = EMLParser()
-        engine = ExtractionEngine()
-        exporter = ExcelExporter()
-        
         parse_start = time.time()
-        parsed_content = parser.parse_eml(eml_path)
-        stage_timings['mime_parsing'] = time.time() - parse_start
+        parsed_content = _PARSER.parse_eml(eml_path)
+        job['stage_timings']['mime_parsing'] = time.time() - parse_start
         
         extract_start = time.time()
-        extracted_data = engine.extract_all_fields(parsed_content)
-        stage_timings['extraction'] = time.time() - extract_start
+        extracted_data = _ENGINE.extract_all_fields(parsed_content)
+        job['stage_timings']['extraction'] = time.time() - extract_start
+        
+        # Only the per-field counters go back to the parent, not the records
+        job['field_success'] = _METRICS.summarize_field_success(extracted_data)
+        
+        job['export_future'] = _EXPORT_POOL.submit(_export_job, extracted_data, output_path)
+        
+    except Exception as e:
+        job['error'] = e
+        job['failed_at'] = time.time()
+    
+    return job
+
+
+def _export_job(extracted_data: List[dict], output_path: Path) -> Tuple[bool, float, float]:
+    """Export one file; returns (success, export seconds, finish timestamp)"""
+    export_start = time.time()
+    success = _EXPORTER.export_to_excel(extracted_data, _TEMPLATE_PATH, output_path)
+    export_end = time.time()
+    return success, export_end - export_start, export_end
+
+
+def _finish_batch_job(job: dict) -> dict:
+    """Wait for a job's export and build its result"""
+    eml_path = job['eml_path']
+    stage_timings = job['stage_timings']
+    
+    try:
+        if job['error'] is not None:
+            raise job['error']
         
-        export_start = time.time()
-        success = exporter.export_to_excel(extracted_data, template_path, output_path)
-        stage_timings['export'] = time.time() - export_start
+        success, export_time, end_time = job['export_future'].result()
+        stage_timings['export'] = export_time
         
-        processing_time = time.time() - start_time
+        processing_time = end_time - job['start_time']
         
         if success:
-            print(f"✓ {eml_path.name} -> {output_path.name} ({processing_time:.2f}s)")
+            _progress_logger.info(f"✓ {eml_path.name} -> {job['output_path'].name} ({processing_time:.2f}s)")
         
         return {
             'success': success,
             'processing_time': processing_time,
             'stage_timings': stage_timings,
-            'extracted_data': extracted_data,
+            'field_success': job['field_success'],
             'file_name': eml_path.name
         }
         
     except Exception as e:
-        processing_time = time.time() - start_time
-        print(f"✗ {eml_path.name}: {str(e)}")
+        processing_time = job.get('failed_at', time.time()) - job['start_time']
+        _progress_logger.error(f"✗ {eml_path.name}: {str(e)}")
         return {
             'success': False,
             'processing_time': processing_time,
             'stage_timings': stage_timings,
-            'extracted_data': [],
+            'field_success': {},
             'file_name': eml_path.name,
             'error': str(e)
         }
@@ -238,6 +365,7 @@ Examples:
     batch_parser.add_argument('--eml-dir', required=True, type=Path, help='Directory containing EML files')
     batch_parser.add_argument('--out-dir', required=True, type=Path, help='Output directory')
     batch_parser.add_argument('--workers', type=int, default=4, help='Number of worker processes')
+    batch_parser.add_argument('--force', action='store_true', help='Reprocess files whose output is already up to date')
     
     args = parser.parse_args()
     
@@ -260,7 +388,7 @@ Examples:
             print(f"Error: EML directory not found: {args.eml_dir}")
             return 1
         
-        success = cli.parse_batch(args.eml_dir, args.out_dir, args.workers)
+        success = cli.parse_batch(args.eml_dir, args.out_dir, args.workers, args.force)
         return 0 if success else 1
 
 
@@ -1,3 +1,3 @@
-from .excel import ExcelExporter
+from .excel import ExcelExporter, read_template_columns
 
-__all__ = ['ExcelExporter']
\ No newline at end of file
+__all__ = ['ExcelExporter', 'read_template_columns']
\ No newline at end of file
@@ -2,24 +2,107 @@
 Excel writer with template matching
 """
 
-import pandas as pd
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import logging
 
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment
+from openpyxl.utils import get_column_letter
+
+# Optional xlsxwriter engine for constant-memory exports
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
 from ..resolve.validators import FieldValidator
 from ..resolve.synonyms import SynonymMapper
 from ..resolve.column_validator import ColumnValidator
+from ..text_utils import digits_only
+
+logger = logging.getLogger(__name__)
+
+# Interned like the extraction engine's sentinel, so == on extracted values hits the identity fast path
+_NOT_FOUND = sys.intern("Information not found")
+_TX_KEY = 'Transaction Type (Add/Update/Term)'
+_CONTACT_FIELDS = ('Phone Number', 'Fax Number')
+_NPI_FIELDS = ('Provider NPI', 'Group NPI')
+_MAX_CONTENT_WIDTH = 48
+
+# Translate table covers Latin-1; rarer characters fall back to the per-character filter
+_NON_PPG_CHARS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if not (chr(c).isalnum() or chr(c) in ', ')
+))
+
+
+def _ppg_chars_only(value: str) -> str:
+    """Keep alphanumerics, commas and spaces"""
+    cleaned = value.translate(_NON_PPG_CHARS)
+    return cleaned if cleaned.isascii() else ''.join(c for c in cleaned if c.isalnum() or c in ', ')
+
+
+def read_template_columns(template_path: Path) -> Optional[List[str]]:
+    """Read column headers from template file, reusing earlier reads of the same file"""
+    if not template_path.exists():
+        logger.warning(f"Template file not found: {template_path}")
+        return None
+    
+    columns = _load_template_columns(str(template_path), template_path.stat().st_mtime)
+    return list(columns) if columns else None
+
+
+@lru_cache(maxsize=4)
+def _load_template_columns(template_path: str, mtime: float) -> Optional[Tuple[str, ...]]:
+    """
+    Parse the template header row
+    Keyed on modification time so an edited template is picked up again
+    """
+    try:
+        workbook = load_workbook(template_path, read_only=True, data_only=True)
+        try:
+            if 'Output' in workbook.sheetnames:
+                worksheet = workbook['Output']
+            else:
+                logger.warning("Template has no 'Output' sheet, using the active sheet")
+                worksheet = workbook.active
+            return _read_header_row(worksheet)
+        finally:
+            workbook.close()
+        
+    except Exception as e:
+        logger.error(f"Could not read template columns: {str(e)}")
+        return None
+
+
+def _read_header_row(worksheet) -> Tuple[str, ...]:
+    """Read the first row of a worksheet as column names"""
+    header = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+    return tuple(str(value) for value in header if value is not None)
 
 
 class ExcelExporter:
-    def __init__(self):
+    def __init__(self, expected_columns: Optional[List[str]] = None, engine: str = 'openpyxl'):
         self.logger = logging.getLogger(__name__)
         self.validator = FieldValidator()
         self.synonym_mapper = SynonymMapper()
         self.column_validator = ColumnValidator()
         
-        self.expected_columns = self.column_validator.get_column_names()
+        if engine not in ('xlsxwriter', 'openpyxl'):
+            raise ValueError(f"Unsupported Excel engine: {engine}")
+        if engine == 'xlsxwriter' and not HAS_XLSXWRITER:
+            self.logger.info("xlsxwriter not available, exporting with openpyxl")
+            engine = 'openpyxl'
+        self.engine = engine
+        
+        # Template columns read ahead of time (e.g. once per batch) skip the per-export read
+        self.template_columns = tuple(expected_columns) if expected_columns else None
+        self._set_expected_columns(self.template_columns or self.column_validator.get_column_names())
     
     def export_to_excel(
         self, 
@@ -29,10 +112,11 @@ class ExcelExporter:
     ) -> bool:
 
         try:
-            template_columns = self._read_template_columns(template_path)
+            template_columns = self.template_columns or self._read_template_columns(template_path)
             
             if template_columns:
-                self.expected_columns = template_columns
+                if tuple(template_columns) != self.expected_columns:
+                    self._set_expected_columns(template_columns)
                 self.logger.info(f"Using template column order: {len(template_columns)} columns")
             else:
                 self.logger.warning("Could not read template, using default column order")
@@ -50,15 +134,7 @@ class ExcelExporter:
                 
                 processed_records.append(processed_record)
             
-            df = pd.DataFrame(processed_records, columns=self.expected_columns)
-            
-            for col in self.expected_columns:
-                if col not in df.columns:
-                    df[col] = "Information not found"
-            
-            df = df[self.expected_columns]
-            
-            self._write_excel_file(df, output_path)
+            self._write_excel_file(processed_records, output_path)
             
             self.logger.info(f"Successfully exported {len(processed_records)} records to {output_path}")
             return True
@@ -67,32 +143,28 @@ class ExcelExporter:
             self.logger.error(f"Excel export failed: {str(e)}")
             return False
     
+    def _set_expected_columns(self, columns: List[str]):
+        """Fix the output column order as a tuple and index each column's position"""
+        self.expected_columns = tuple(columns)
+        self._col_index = {col: i for i, col in enumerate(self.expected_columns)}
+    
     def _read_template_columns(self, template_path: Path) -> Optional[List[str]]:
         """Read column headers from template file"""
-        try:
-            if not template_path.exists():
-                self.logger.warning(f"Template file not found: {template_path}")
-                return None
-            
-            df = pd.read_excel(template_path, sheet_name='Output')
-            return list(df.columns)
-            
-        except Exception as e:
-            self.logger.error(f"Could not read template columns: {str(e)}")
-            try:
-                df = pd.read_excel(template_path)
-                return list(df.columns)
-            except Exception as e2:
-                self.logger.error(f"Fallback template read also failed: {str(e2)}")
-                return None
+        return read_template_columns(template_path)
     
     def _process_record(self, record: Dict[str, str], record_index: int) -> Dict[str, str]:
         """
         Process a single record: validate, normalize, and ensure completeness
         """
-        processed = record.copy()
+        # The only copy in the pipeline: everything below mutates `processed` in place.
+        # Missing columns are filled up front; the normalizers and validators leave
+        # "Information not found" untouched.
+        processed = dict(record)
+        missing = self._col_index.keys() - processed.keys()
+        if missing:
+            processed.update(dict.fromkeys(missing, _NOT_FOUND))
         
-        processed = self.synonym_mapper.apply_all_normalizations(processed)
+        self.synonym_mapper.apply_all_normalizations(processed)
         
         validation_results = self.validator.validate_and_normalize_all(processed)
         
@@ -100,11 +172,7 @@ class ExcelExporter:
             if not result.is_valid:
                 self.logger.warning(f"Record {record_index} - {field}: {result.message}")
         
-        for col in self.expected_columns:
-            if col not in processed:
-                processed[col] = "Information not found"
-        
-        processed = self._apply_business_rules(processed)
+        self._apply_business_rules(processed)
         
         return processed
     
@@ -112,115 +180,166 @@ class ExcelExporter:
         """
         Apply business rules and cross-field logic
         """
-        transaction_type = record.get('Transaction Type (Add/Update/Term)', '').lower()
+        rec_get = record.get
+        transaction_type = rec_get(_TX_KEY, '').lower()
         
         if transaction_type == 'term':
-            if record.get('Term Date') == "Information not found" and record.get('Effective Date') != "Information not found":
+            if rec_get('Term Date') == _NOT_FOUND and rec_get('Effective Date') != _NOT_FOUND:
                 
                 record['Term Date'] = record['Effective Date']
-                record['Effective Date'] = "Information not found"
+                record['Effective Date'] = _NOT_FOUND
         else:
-            record['Term Date'] = "Information not found"
+            record['Term Date'] = _NOT_FOUND
         
         if transaction_type == 'term':
             record['Transaction Attribute'] = 'Provider'
         elif transaction_type == 'add':
-            record['Transaction Attribute'] = "Information not found"
+            record['Transaction Attribute'] = _NOT_FOUND
         
         if transaction_type != 'term':
-            record['Term Reason'] = "Information not found"
+            record['Term Reason'] = _NOT_FOUND
         
-        for field in ['Phone Number', 'Fax Number']:
-            if field in record and record[field] != "Information not found":
-                digits = ''.join(filter(str.isdigit, record[field]))
+        for field in _CONTACT_FIELDS:
+            value = rec_get(field, _NOT_FOUND)
+            if value != _NOT_FOUND:
+                digits = digits_only(value)
                 if len(digits) == 10:
                     record[field] = f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
         
-        for field in ['Provider NPI', 'Group NPI']:
-            if field in record and record[field] != "Information not found":
-                record[field] = ''.join(filter(str.isdigit, record[field]))
+        for field in _NPI_FIELDS:
+            value = rec_get(field, _NOT_FOUND)
+            if value != _NOT_FOUND:
+                record[field] = digits_only(value)
         
-        if 'TIN' in record and record['TIN'] != "Information not found":
-            tin_digits = ''.join(filter(str.isdigit, record['TIN']))
+        tin = rec_get('TIN', _NOT_FOUND)
+        if tin != _NOT_FOUND:
+            tin_digits = digits_only(tin)
             if len(tin_digits) == 9:
                 record['TIN'] = f"{tin_digits[:2]}-{tin_digits[2:]}"
         
-        if 'PPG ID' in record and record['PPG ID'] != "Information not found":
-            record['PPG ID'] = ''.join(c for c in record['PPG ID'] if c.isalnum() or c in ', ')
+        ppg_id = rec_get('PPG ID', _NOT_FOUND)
+        if ppg_id != _NOT_FOUND:
+            record['PPG ID'] = _ppg_chars_only(ppg_id)
         
         return record
     
-    def _write_excel_file(self, df: pd.DataFrame, output_path: Path):
+    def _write_excel_file(self, records: List[Dict[str, str]], output_path: Path):
         """
-        Write DataFrame to Excel with proper formatting
+        Stream processed records to Excel with the configured engine
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with pd.ExcelWriter(
-            output_path,
-            engine='openpyxl'
-        ) as writer:
-            
-            df.to_excel(
-                writer,
-                sheet_name='Output',
-                index=False,
-                header=True
-            )
+        headers = self.expected_columns
+        
+        # Column widths are tracked while rows are built, capped at the 50 char maximum
+        widths = [min(len(str(header)), _MAX_CONTENT_WIDTH) for header in headers]
+        rows = []
+        for record in records:
+            row = list(map(record.__getitem__, headers))
+            for i, value in enumerate(row):
+                if widths[i] < _MAX_CONTENT_WIDTH:
+                    widths[i] = min(max(widths[i], len(str(value))), _MAX_CONTENT_WIDTH)
+            rows.append(row)
+        
+        # Written beside the output and moved into place only once complete, so a failed
+        # export never leaves a partial workbook that batch runs would take as up to date
+        tmp_path = output_path.with_name(f".{output_path.stem}.{os.getpid()}.tmp{output_path.suffix}")
+        try:
+            if self.engine == 'xlsxwriter':
+                self._write_with_xlsxwriter(headers, rows, widths, tmp_path)
+            else:
+                self._write_with_openpyxl(headers, rows, widths, tmp_path)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _write_with_xlsxwriter(self, headers: List[str], rows: List[list], widths: List[int], output_path: Path):
+        """Write rows with xlsxwriter in constant_memory mode, flushing each row to disk"""
+        workbook = xlsxwriter.Workbook(str(output_path), {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'strings_to_urls': False
+        })
+        try:
+            worksheet = workbook.add_worksheet('Output')
+            header_format = workbook.add_format({'bold': True, 'align': 'left', 'valign': 'vcenter'})
             
-            workbook = writer.book
-            worksheet = writer.sheets['Output']
+            for col_idx, width in enumerate(widths):
+                worksheet.set_column(col_idx, col_idx, width + 2)
+            worksheet.freeze_panes(1, 0)
             
-            self._format_worksheet(worksheet, df)
+            worksheet.write_row(0, 0, headers, header_format)
+            for row_idx, row in enumerate(rows, 1):
+                worksheet.write_row(row_idx, 0, row)
+        finally:
+            workbook.close()
     
-    def _format_worksheet(self, worksheet, df: pd.DataFrame):
-        """Apply basic formatting to the worksheet"""
+    def _write_with_openpyxl(self, headers: List[str], rows: List[list], widths: List[int], output_path: Path):
+        """Write rows through an openpyxl write-only workbook"""
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Output')
+        
+        header_row = self._format_worksheet(worksheet, headers, widths)
+        
+        worksheet.append(header_row)
+        for row in rows:
+            worksheet.append(row)
+        
+        workbook.save(output_path)
+    
+    def _format_worksheet(self, worksheet, headers: List[str], widths: List[int]) -> list:
+        """
+        Apply basic formatting to a write-only worksheet and return the styled header row.
+        Write-only sheets serialize column widths and panes before the first row,
+        so this must run before anything is appended.
+        """
         try:
-            from openpyxl.styles import Font, Alignment
-            
             header_font = Font(bold=True)
-            for cell in worksheet[1]: 
+            header_alignment = Alignment(horizontal='left', vertical='center')
+            
+            styled_row = []
+            for header in headers:
+                cell = WriteOnlyCell(worksheet, value=header)
                 cell.font = header_font
-                cell.alignment = Alignment(horizontal='left', vertical='center')
+                cell.alignment = header_alignment
+                styled_row.append(cell)
             
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+            for col_idx, width in enumerate(widths, 1):
+                worksheet.column_dimensions[get_column_letter(col_idx)].width = width + 2
             
             worksheet.freeze_panes = 'A2'
             
-        except ImportError:
-            self.logger.warning("openpyxl not available for Excel formatting")
+            return styled_row
+            
         except Exception as e:
+            # Never hand back a partly built header; plain values keep every column
             self.logger.warning(f"Excel formatting failed: {str(e)}")
+            return list(headers)
     
     def validate_output(self, output_path: Path) -> bool:
         """
         Validate the created Excel file
         """
         try:
-            df = pd.read_excel(output_path, sheet_name='Output')
+            workbook = load_workbook(output_path, read_only=True)
+            try:
+                rows = workbook['Output'].iter_rows(values_only=True)
+                columns = [str(value) for value in next(rows, ()) if value is not None]
+                row_count = sum(1 for _ in rows)
+            finally:
+                workbook.close()
             
-            missing_columns = set(self.expected_columns) - set(df.columns)
+            missing_columns = self._col_index.keys() - set(columns)
             if missing_columns:
                 self.logger.error(f"Output file missing columns: {missing_columns}")
                 return False
             
-            if len(df) == 0:
+            if row_count == 0:
                 self.logger.warning("Output file contains no data rows")
                 return False
             
-            self.logger.info(f"Output validation passed: {len(df)} rows, {len(df.columns)} columns")
+            self.logger.info(f"Output validation passed: {row_count} rows, {len(columns)} columns")
             return True
             
         except Exception as e:
@@ -3,15 +3,21 @@ Hybrid Extraction Engine: Combines deterministic + ML extractors with fusion
 """
 
 import re
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import sys
+from typing import Callable, Dict, List, Optional
+from dataclasses import dataclass, replace
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
 
 from ..ingest.eml_parser import ParsedContent
 from ..sectioner.block_split import BlockSectioner, ProviderBlock
 from .patterns import PatternExtractor, ExtractionCandidate
 from .ner import NERExtractor
 from .tables import TableExtractor
+from .keywords import PhraseScanner
 
 
 @dataclass
@@ -28,14 +34,290 @@ class FieldResult:
             self.candidates = []
 
 
+# Single shared sentinel object so "not found" checks are identity comparisons
+_NOT_FOUND = sys.intern("Information not found")
+_VALUE_GETTER = attrgetter('value')
+_CONFIDENCE_GETTER = attrgetter('confidence')
+
+# Table fields that should be unique per provider block
+_PROVIDER_SPECIFIC_FIELDS = frozenset({
+    'provider_name', 'npi', 'specialty', 'license', 'phone', 'fax',
+    'ppg', 'organization'
+})
+
+_EXPLICIT_ATTRIBUTE_RES = tuple(re.compile(p) for p in (
+    r'transaction\s+attribute\s*:\s*([^\n\r]+)',
+    r'attribute\s*:\s*([^\n\r]+)',
+    r'changed\s+attribute\s*:\s*([^\n\r]+)',
+    r'update\s+type\s*:\s*([^\n\r]+)'
+))
+# Every explicit attribute pattern contains one of these literals
+_EXPLICIT_ATTRIBUTE_ANCHORS = ('attribute', 'update')
+
+_ATTRIBUTE_MAPPINGS = {
+    'not applicable': 'Not Applicable',
+    'n/a': 'Not Applicable', 
+    'na': 'Not Applicable',
+    'none': 'Not Applicable',
+    'address': 'Address',
+    'location': 'Address',
+    'specialty': 'Specialty',
+    'specialization': 'Specialty',
+    'phone': 'Phone Number',
+    'phone number': 'Phone Number',
+    'telephone': 'Phone Number',
+    'contact': 'Phone Number',
+    'ppg': 'PPG',
+    'ppg id': 'PPG',
+    'practice group': 'PPG',
+    'lob': 'LOB',
+    'line of business': 'LOB',
+    'network': 'LOB',
+    'provider': 'Provider',
+    'general': 'Provider',
+    'demographic': 'Provider'
+}
+
+_ATTRIBUTE_CONTEXT_PATTERNS = {
+    'Address': {
+        'explicit': [  
+            ('address change', 3.0), ('address update', 3.0), ('location change', 3.0),
+            ('office change', 3.0), ('practice location', 2.8), ('new address', 2.5),
+            ('relocate', 2.5), ('relocation', 2.5), ('move', 2.3), ('transfer', 2.0)
+        ],
+        'contextual': [ 
+            ('address', 1.5), ('location', 1.2), ('street', 1.8), ('suite', 1.8),
+            ('building', 1.5), ('zip', 1.8), ('city', 1.0), ('state', 0.8)
+        ],
+        'subjects': [  
+            (re.compile(r'address.*change'), 2.5),
+            (re.compile(r'location.*update'), 2.5),
+            (re.compile(r'move.*office'), 2.0)
+        ]
+    },
+    'Specialty': {
+        'explicit': [
+            ('specialty change', 3.0), ('specialty update', 3.0), ('specialization change', 2.8),
+            ('practice change', 2.5), ('field change', 2.5), ('new specialty', 2.3)
+        ],
+        'contextual': [
+            ('specialty', 1.8), ('specialization', 1.5), ('practice area', 1.5),
+            ('medical field', 1.3), ('discipline', 1.2), ('board certified', 1.0)
+        ],
+        'subjects': [
+            (re.compile(r'specialty.*change'), 2.5), (re.compile(r'practice.*update'), 2.0)
+        ]
+    },
+    'Phone Number': {
+        'explicit': [
+            ('phone change', 3.0), ('phone update', 3.0), ('contact change', 2.8),
+            ('phone number change', 3.2), ('telephone change', 3.0), ('fax change', 2.8),
+            ('contact update', 2.5), ('new phone', 2.3), ('new contact', 2.0)
+        ],
+        'contextual': [
+            ('phone', 1.8), ('telephone', 1.5), ('fax', 1.5), ('contact', 1.2),
+            ('number', 1.0)
+        ],
+        'subjects': [
+            (re.compile(r'phone.*change'), 2.5),
+            (re.compile(r'contact.*update'), 2.5),
+            (re.compile(r'fax.*change'), 2.5)
+        ]
+    },
+    'PPG': {
+        'explicit': [
+            ('ppg change', 3.0), ('ppg update', 3.0), ('group change', 2.5),
+            ('practice group change', 3.2), ('ppg id change', 3.0), ('new ppg', 2.3)
+        ],
+        'contextual': [
+            ('ppg', 2.0), ('practice group', 1.8), ('group id', 1.5), ('ppg id', 2.0)
+        ],
+        'subjects': [
+            (re.compile(r'ppg.*change'), 2.5), (re.compile(r'group.*update'), 2.0)
+        ]
+    },
+    'LOB': {
+        'explicit': [
+            ('lob change', 3.0), ('network change', 2.8), ('line of business change', 3.2),
+            ('plan change', 2.5), ('coverage change', 2.5), ('insurance change', 2.3)
+        ],
+        'contextual': [
+            ('line of business', 2.0), ('lob', 1.8), ('network', 1.5), ('medicare', 1.3),
+            ('commercial', 1.3), ('medicaid', 1.3), ('insurance', 1.2), ('plan', 1.0)
+        ],
+        'subjects': [
+            (re.compile(r'lob.*change'), 2.5),
+            (re.compile(r'network.*update'), 2.5),
+            (re.compile(r'plan.*change'), 2.0)
+        ]
+    },
+    'Provider': {
+        'explicit': [ 
+            ('provider change', 2.0), ('provider update', 2.0), ('provider information', 1.8),
+            ('demographic change', 2.2), ('information update', 1.5)
+        ],
+        'contextual': [
+            ('provider', 1.0), ('doctor', 0.8), ('physician', 0.8), ('demographic', 1.2),
+            ('information', 0.5), ('data', 0.5)
+        ],
+        'subjects': [
+            (re.compile(r'provider.*update'), 2.0), (re.compile(r'information.*change'), 1.5)
+        ]
+    }
+}
+
+_ATTRIBUTES = tuple(_ATTRIBUTE_CONTEXT_PATTERNS)
+
+# Subject regexes as (attribute index, pattern, weight) so scoring works on a flat list
+_ATTRIBUTE_SUBJECT_RES = tuple(
+    (idx, pattern, weight * 1.2)
+    for idx, patterns in enumerate(_ATTRIBUTE_CONTEXT_PATTERNS.values())
+    for pattern, weight in patterns['subjects']
+)
+
+# Explicit and contextual phrases get one scanner each; every hit carries (attribute index, weight)
+def _attribute_phrase_scanner(kind: str) -> PhraseScanner:
+    return PhraseScanner(
+        (phrase, (idx, weight))
+        for idx, patterns in enumerate(_ATTRIBUTE_CONTEXT_PATTERNS.values())
+        for phrase, weight in patterns[kind]
+    )
+
+
+_ATTRIBUTE_EXPLICIT_SCANNER = _attribute_phrase_scanner('explicit')
+_ATTRIBUTE_CONTEXTUAL_SCANNER = _attribute_phrase_scanner('contextual')
+
+# Most an attribute can still gain after the explicit pass (all contextual phrases and subjects hit)
+_ATTRIBUTE_SCORE_BOUNDS = tuple(
+    sum(weight for _, weight in patterns['contextual']) + sum(weight * 1.2 for _, weight in patterns['subjects'])
+    for patterns in _ATTRIBUTE_CONTEXT_PATTERNS.values()
+)
+
+# Tie-breaker phrases for attributes whose context scores are within 1.0 of each other
+_ATTRIBUTE_STRONG_INDICATORS = {
+    'Address': ('street', 'suite', 'zip code', 'city', 'state', 'building', 'floor'),
+    'Specialty': ('board certified', 'residency', 'fellowship', 'medical school', 'practice area'),
+    'Phone Number': ('extension', 'ext', 'area code', 'toll free', 'direct line'),
+    'PPG': ('group number', 'practice id', 'group code'),
+    'LOB': ('effective date', 'coverage', 'eligibility', 'enrollment'),
+    'Provider': ('credentials', 'license', 'certification', 'npi', 'name change')
+}
+
+# Phrases naming the single attribute a termination/addition applies to, in priority order
+_TERM_PHRASE_TO_ATTR = {
+    'address termination': 'Address',
+    'phone termination': 'Phone Number',
+    'ppg termination': 'PPG',
+    'lob termination': 'LOB',
+    'terminate address only': 'Address',
+    'terminate phone only': 'Phone Number',
+    'terminate ppg only': 'PPG',
+    'terminate lob only': 'LOB',
+    'specialty termination': 'Specialty'
+}
+
+_ADD_PHRASE_TO_ATTR = {
+    'add new address to': 'Address',
+    'add new specialty to': 'Specialty',
+    'add new phone to': 'Phone Number',
+    'add new ppg to': 'PPG',
+    'add new lob to': 'LOB',
+    'include new address in': 'Address',
+    'include new specialty in': 'Specialty',
+    'include new phone in': 'Phone Number'
+}
+
+
+def _priority_phrase_scanner(phrase_to_attr: Dict[str, str]) -> PhraseScanner:
+    return PhraseScanner(
+        (phrase, (priority, attribute)) for priority, (phrase, attribute) in enumerate(phrase_to_attr.items())
+    )
+
+
+# Transaction types whose attribute comes from a phrase scan, with the scanner to use
+_PHRASE_ATTRIBUTE_SCANNERS = {
+    'term': _priority_phrase_scanner(_TERM_PHRASE_TO_ATTR),
+    'add': _priority_phrase_scanner(_ADD_PHRASE_TO_ATTR),
+}
+
+# Term reason keywords in priority order; the first category with any keyword present wins
+_TERM_REASON_KEYWORDS = [
+    (['voluntary', 'voluntarily', 'by choice', 'provider choice', 'own choice'], 'Voluntary'),
+    (['retired', 'retirement', 'retiring', 'end of career'], 'Retired'),
+    (['contract end', 'contract ended', 'contract expir', 'agreement end', 'term of contract'], 'Contract Ended'),
+    (['non-renewal', 'not renewed', 'renewal denied'], 'Contract Not Renewed'),
+    (['performance', 'quality concern', 'quality issue', 'disciplinary'], 'Performance Issues'),
+    (['credentialing', 'credential', 'licensing issue', 'license problem'], 'Credentialing Issues'),
+    (['relocat', 'relocation', 'moved', 'moving', 'geographic', 'out of area'], 'Relocation'),
+    (['business', 'financial', 'practice sold', 'practice closed', 'consolidation'], 'Business Decision'),
+    (['deceased', 'death', 'disability', 'unable to practice'], 'Death/Disability'),
+    (['network change', 'panel', 'network restructur', 'plan change'], 'Network Changes'),
+    (['involuntary', 'terminated', 'dismissal', 'termination'], 'Involuntary'),
+    (['administrative', 'clerical', 'other'], 'Other')
+]
+
+_TERM_REASON_SCANNER = PhraseScanner(
+    (keyword, priority)
+    for priority, (keywords, _) in enumerate(_TERM_REASON_KEYWORDS)
+    for keyword in keywords
+)
+
+# Reason context patterns in priority order; every match of an earlier pattern is tried first
+_REASON_CONTEXT_PATTERNS = [
+    re.compile(r'reason[:\s]+([^,.\n]+)'),
+    re.compile(r'term(?:ination)?\s+reason[:\s]+([^,.\n]+)'),
+    re.compile(r'due\s+to[:\s]+([^,.\n]+)'),
+    re.compile(r'because\s+of[:\s]+([^,.\n]+)'),
+    re.compile(r'result\s+of[:\s]+([^,.\n]+)'),
+]
+
+# Keyword categories for reason/LOB canonicalization, in priority order
+_REASON_CATEGORIES = {
+    'voluntary': ('Voluntary', ['voluntary', 'choice']),
+    'retired': ('Retired', ['retired', 'retirement']),
+    'contract': ('Contract Ended', ['contract', 'agreement']),
+    'relocation': ('Relocation', ['relocation', 'moved', 'moving']),
+    'performance': ('Performance Issues', ['performance', 'quality']),
+}
+
+_LOB_CATEGORIES = {
+    'medicare': ('Medicare', ['medicare', 'part a', 'part b', 'part c', 'part d']),
+    'medicaid': ('Medicaid', ['medicaid', 'medi-cal']),
+    'commercial': ('Commercial', ['commercial', 'hmo', 'ppo', 'epo', 'pos', 'exchange']),
+}
+
+
+def _compile_categories(categories: Dict[str, tuple]) -> re.Pattern:
+    """Build one alternation with a named group per category"""
+    return re.compile('|'.join(
+        f"(?P<{group}>{'|'.join(map(re.escape, words))})" for group, (_, words) in categories.items()
+    ))
+
+
+def _match_category(pattern: re.Pattern, text: str, categories: Dict[str, tuple]) -> Optional[str]:
+    """Return the label of the highest-priority category found anywhere in text"""
+    found = {match.lastgroup for match in pattern.finditer(text)}
+    if found:
+        for group, (label, _) in categories.items():
+            if group in found:
+                return label
+    return None
+
+
+_REASON_CATEGORY_RE = _compile_categories(_REASON_CATEGORIES)
+_LOB_CATEGORY_RE = _compile_categories(_LOB_CATEGORIES)
+
+
 class ExtractionEngine:
     """
     Hybrid extraction engine that combines multiple extraction methods
     with candidate scoring and fusion
     """
     
-    def __init__(self):
+    def __init__(self, block_workers: int = 1):
         self.logger = logging.getLogger(__name__)
+        # Threads used to extract provider blocks of one email concurrently (1 = sequential)
+        self.block_workers = max(1, block_workers)
         
         # Initialize extractors
         self.sectioner = BlockSectioner()
@@ -43,7 +325,7 @@ class ExtractionEngine:
         self.ner_extractor = NERExtractor()
         self.table_extractor = TableExtractor()
         
-        self.output_fields = [
+        self.output_fields = (
             'Transaction Type (Add/Update/Term)',
             'Transaction Attribute',
             'Effective Date',
@@ -61,7 +343,7 @@ class ExtractionEngine:
             'Fax Number',
             'PPG ID',
             'Line Of Business (Medicare/Commercial/Medical)'
-        ]
+        )
         
         self.extractor_priorities = {
             'table_': 100,  
@@ -78,6 +360,16 @@ class ExtractionEngine:
             'specialty_gazetteer': 80,
             'lob_gazetteer': 85,
         }
+        
+        self._empty_output_template = dict.fromkeys(self.output_fields, _NOT_FOUND)
+        
+        # Transaction Attribute handler per lowercased transaction type
+        self._transaction_attribute_handlers = {
+            transaction_type: partial(self._phrase_transaction_attribute, scanner)
+            for transaction_type, scanner in _PHRASE_ATTRIBUTE_SCANNERS.items()
+        }
+        # explicit attribute already ruled out by the caller, go straight to context scoring
+        self._transaction_attribute_handlers['update'] = self._analyze_transaction_attribute_context
     
     def extract_all_fields(self, parsed_content: ParsedContent) -> List[Dict[str, str]]:
         """
@@ -95,10 +387,32 @@ class ExtractionEngine:
             )
             blocks = [single_block]
         
-        results = []
-        for i, block in enumerate(blocks):
-            result = self._extract_from_block_smart(block, i, parsed_content)
-            results.append(result)
+        # Everything that depends only on the email is computed once and shared by all blocks;
+        # tables are parsed here and each block only filters the candidates
+        attribute_text = parsed_content.text_content + '\n' + parsed_content.normalized_text
+        all_table_candidates = self._extract_from_tables(parsed_content)
+        email_cache = {}
+        extract_block = partial(
+            self._extract_from_block_smart,
+            parsed_content=parsed_content,
+            all_table_candidates=all_table_candidates,
+            shared_table_candidates=self._downweight_shared_candidates(all_table_candidates),
+            table_value_scanner=self._build_table_value_scanner(all_table_candidates),
+            full_text_lower=parsed_content.normalized_text.lower(),
+            attribute_text=attribute_text,
+            attribute_text_lower=attribute_text.lower(),
+            email_cache=email_cache,
+            transaction_type=self._extract_transaction_type_smart(parsed_content.normalized_text, email_cache)
+        )
+        
+        if self.block_workers > 1 and len(blocks) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(blocks), self.block_workers)) as pool:
+                results = list(pool.map(extract_block, blocks, range(len(blocks))))
+        else:
+            results = []
+            for i, block in enumerate(blocks):
+                result = extract_block(block, i)
+                results.append(result)
         
         if not results:
             results = [self._create_empty_result()]
@@ -111,51 +425,80 @@ class ExtractionEngine:
         self, 
         block: ProviderBlock, 
         block_idx: int,
-        parsed_content: ParsedContent
+        parsed_content: ParsedContent,
+        all_table_candidates: Optional[Dict[str, List[ExtractionCandidate]]] = None,
+        shared_table_candidates: Optional[Dict[str, List[ExtractionCandidate]]] = None,
+        table_value_scanner: Optional[PhraseScanner] = None,
+        full_text_lower: Optional[str] = None,
+        attribute_text: Optional[str] = None,
+        attribute_text_lower: Optional[str] = None,
+        email_cache: Optional[Dict[str, list]] = None,
+        transaction_type: Optional[str] = None
     ) -> Dict[str, str]:
         """
         Smart extraction that uses optimal source prioritization to avoid redundancy.
         """
-        output = {}
-        for field in self.output_fields:
-            output[field] = "Information not found"
+        output = self._empty_output_template.copy()
+        
+        block_text_lower = block.text.lower()
+        if full_text_lower is None:
+            full_text_lower = parsed_content.normalized_text.lower()
+        if attribute_text is None:
+            attribute_text = parsed_content.text_content + '\n' + parsed_content.normalized_text
+        
+        # Parse block text, email text and the email body used for organizations in one spaCy
+        # batch; the NER helpers reuse the cached Docs
+        self.ner_extractor.preprocess(
+            [block.text, parsed_content.normalized_text],
+            organization_texts=[parsed_content.normalized_text]
+        )
         
-        table_candidates = self._extract_from_tables_block_aware(block, parsed_content)
+        table_candidates = self._extract_from_tables_block_aware(
+            block, parsed_content, all_table_candidates, block_text_lower,
+            shared_table_candidates, table_value_scanner
+        )
         
-        output['Transaction Type (Add/Update/Term)'] = self._extract_transaction_type_smart(parsed_content.normalized_text)
+        if transaction_type is None:
+            transaction_type = self._extract_transaction_type_smart(parsed_content.normalized_text, email_cache)
+        output['Transaction Type (Add/Update/Term)'] = transaction_type
         
-        output['Provider Name'] = self._extract_provider_name_smart(table_candidates, block.text, parsed_content.normalized_text)
+        output['Provider Name'] = self._extract_provider_name_smart(table_candidates, block.text, parsed_content.normalized_text, email_cache)
         
-        output['Provider NPI'] = self._extract_npi_smart(table_candidates, parsed_content.normalized_text, block.text)
+        output['Provider NPI'] = self._extract_npi_smart(table_candidates, parsed_content.normalized_text, block.text, email_cache)
         
-        output['TIN'] = self._extract_tin_smart(parsed_content.normalized_text, table_candidates, block.text)
+        output['TIN'] = self._extract_tin_smart(parsed_content.normalized_text, table_candidates, block.text, email_cache)
         
-        effective_date, term_date = self._extract_dates_smart(table_candidates, parsed_content.normalized_text, block.text, output['Transaction Type (Add/Update/Term)'])
+        effective_date, term_date = self._extract_dates_smart(
+            table_candidates, parsed_content.normalized_text, block.text, transaction_type, email_cache
+        )
         output['Effective Date'] = effective_date
         output['Term Date'] = term_date
         
-        if output['Transaction Type (Add/Update/Term)'].lower() == 'term':
-            output['Term Reason'] = self._extract_term_reason_smart(parsed_content.normalized_text, table_candidates, block.text)
+        if transaction_type.lower() == 'term':
+            output['Term Reason'] = self._extract_term_reason_smart(
+                parsed_content.normalized_text, table_candidates, block.text, full_text_lower, block_text_lower
+            )
         
-        output['Provider Specialty'] = self._extract_specialty_smart(table_candidates, block.text, parsed_content.normalized_text)
+        output['Provider Specialty'] = self._extract_specialty_smart(table_candidates, block.text, parsed_content.normalized_text, email_cache)
         
-        output['Organization Name'] = self._extract_organization_smart(parsed_content.normalized_text, block.text, table_candidates)
+        output['Organization Name'] = self._extract_organization_smart(parsed_content.normalized_text, block.text, table_candidates, email_cache)
         
-        output['PPG ID'] = self._extract_ppg_smart(parsed_content.normalized_text, table_candidates, block.text)
+        output['PPG ID'] = self._extract_ppg_smart(parsed_content.normalized_text, table_candidates, block.text, email_cache)
         
-        output['Phone Number'] = self._extract_phone_smart(block.text, parsed_content.normalized_text)
-        output['Fax Number'] = self._extract_fax_smart(table_candidates, block.text, parsed_content.normalized_text)
+        output['Phone Number'] = self._extract_phone_smart(block.text, parsed_content.normalized_text, email_cache)
+        output['Fax Number'] = self._extract_fax_smart(table_candidates, block.text, parsed_content.normalized_text, email_cache)
         
-        output['State License'] = self._extract_license_smart(block.text, parsed_content.normalized_text, table_candidates)
+        output['State License'] = self._extract_license_smart(block.text, parsed_content.normalized_text, table_candidates, email_cache)
         
-        output['Line Of Business (Medicare/Commercial/Medical)'] = self._extract_lob_smart(parsed_content.normalized_text, block.text)
+        output['Line Of Business (Medicare/Commercial/Medical)'] = self._extract_lob_smart(parsed_content.normalized_text, block.text, email_cache)
         
-        full_text = parsed_content.text_content + '\n' + parsed_content.normalized_text
-        output['Transaction Attribute'] = self._extract_transaction_attribute_smart(output['Transaction Type (Add/Update/Term)'], full_text)
+        output['Transaction Attribute'] = self._extract_transaction_attribute_smart(
+            transaction_type, attribute_text, attribute_text_lower
+        )
         
-        output['Complete Address'] = self._extract_address_smart(table_candidates, block.text, parsed_content.normalized_text)
+        output['Complete Address'] = self._extract_address_smart(table_candidates)
         
-        output['Group NPI'] = self._extract_group_npi_smart(table_candidates, parsed_content.normalized_text, block.text)
+        output['Group NPI'] = self._extract_group_npi_smart(table_candidates, parsed_content.normalized_text, block.text, email_cache)
         
         return output
     
@@ -163,7 +506,7 @@ class ExtractionEngine:
     
     
     def _extract_from_tables(self, parsed_content: ParsedContent) -> Dict[str, List[ExtractionCandidate]]:
-        candidates = {}
+        candidates = defaultdict(list)
         
         if parsed_content.html_content:
             tables = self.table_extractor.extract_from_html_table(parsed_content.html_content)
@@ -175,51 +518,73 @@ class ExtractionEngine:
         if text_tables:
             text_table_candidates = self.table_extractor.extract_candidates_from_tables(text_tables)
             for field, field_candidates in text_table_candidates.items():
-                if field not in candidates:
-                    candidates[field] = []
                 candidates[field].extend(field_candidates)
         
-        return candidates
-    
-    def _extract_from_tables_block_aware(self, block: ProviderBlock, parsed_content: ParsedContent) -> Dict[str, List[ExtractionCandidate]]:
+        return dict(candidates)
+    
+    def _extract_from_tables_block_aware(
+        self,
+        block: ProviderBlock,
+        parsed_content: ParsedContent,
+        all_candidates: Optional[Dict[str, List[ExtractionCandidate]]] = None,
+        block_text_lower: Optional[str] = None,
+        shared_candidates: Optional[Dict[str, List[ExtractionCandidate]]] = None,
+        value_scanner: Optional[PhraseScanner] = None
+    ) -> Dict[str, List[ExtractionCandidate]]:
         """Extract candidates from tables, but filter to only include data from the current block"""
         candidates = {}
         
-        all_candidates = self._extract_from_tables(parsed_content)
+        if all_candidates is None:
+            all_candidates = self._extract_from_tables(parsed_content)
         
-        block_text_lower = block.text.lower()
+        if block_text_lower is None:
+            block_text_lower = block.text.lower()
+        
+        if shared_candidates is None:
+            shared_candidates = self._downweight_shared_candidates(all_candidates)
+        
+        if value_scanner is None:
+            value_scanner = self._build_table_value_scanner(all_candidates)
+        
+        # One pass over the block finds every candidate value it contains
+        in_block = {hit for hits in value_scanner.find_all(block_text_lower).values() for hit in hits}
         
         for field, field_candidates in all_candidates.items():
             block_specific_candidates = []
             
-            for candidate in field_candidates:
-                candidate_value = candidate.value.lower()
-                
-                if candidate_value in block_text_lower:
+            for idx, candidate in enumerate(field_candidates):
+                if (field, idx) in in_block:
                     block_specific_candidates.append(candidate)
-                elif not self._is_provider_specific_field(field):
-                    candidate_copy = ExtractionCandidate(
-                        value=candidate.value,
-                        confidence=candidate.confidence * 0.6,
-                        extractor_id=candidate.extractor_id,
-                        position=candidate.position,
-                        context=candidate.context,
-                        validation_passed=candidate.validation_passed
-                    )
-                    block_specific_candidates.append(candidate_copy)
+                elif field in shared_candidates:
+                    block_specific_candidates.append(shared_candidates[field][idx])
             
             if block_specific_candidates:
                 candidates[field] = block_specific_candidates
         
         return candidates
     
+    def _build_table_value_scanner(self, all_candidates: Dict[str, List[ExtractionCandidate]]) -> PhraseScanner:
+        """Scanner over lowercased candidate values keyed by (field, index), built once per email"""
+        return PhraseScanner(
+            (candidate.value.lower(), (field, idx))
+            for field, field_candidates in all_candidates.items()
+            for idx, candidate in enumerate(field_candidates)
+        )
+    
+    def _downweight_shared_candidates(
+        self,
+        all_candidates: Dict[str, List[ExtractionCandidate]]
+    ) -> Dict[str, List[ExtractionCandidate]]:
+        """Reduced-confidence copies of non provider-specific candidates, built once per email"""
+        return {
+            field: [replace(candidate, confidence=candidate.confidence * 0.6) for candidate in field_candidates]
+            for field, field_candidates in all_candidates.items()
+            if not self._is_provider_specific_field(field)
+        }
+    
     def _is_provider_specific_field(self, field: str) -> bool:
         """Determine if a field is provider-specific (should be unique per provider block)"""
-        provider_specific_fields = {
-            'provider_name', 'npi', 'specialty', 'license', 'phone', 'fax', 
-            'ppg', 'organization'
-        }
-        return field in provider_specific_fields
+        return field in _PROVIDER_SPECIFIC_FIELDS
     
     
     
@@ -228,67 +593,35 @@ class ExtractionEngine:
     
     def _map_lob_to_canonical(self, lob: str) -> str:
         """Map LOB variant to canonical form (copied from NER extractor)"""
-        lob_lower = lob.lower()
-        
-        if any(x in lob_lower for x in ['medicare', 'part a', 'part b', 'part c', 'part d']):
-            return 'Medicare'
-        elif any(x in lob_lower for x in ['medicaid', 'medi-cal']):
-            return 'Medicaid'
-        elif any(x in lob_lower for x in ['commercial', 'hmo', 'ppo', 'epo', 'pos', 'exchange']):
-            return 'Commercial'
-        else:
-            return lob.title()
+        canonical = _match_category(_LOB_CATEGORY_RE, lob.lower(), _LOB_CATEGORIES)
+        return canonical if canonical else lob.title()
     
-    def _extract_transaction_attribute(self, text: str) -> str:
+    def _extract_transaction_attribute(self, text: str, text_lower: Optional[str] = None) -> str:
         """
         Extract what specific attribute is being updated using contextual analysis
         Returns exactly one of: Specialty, Provider, Address, PPG, Phone Number, LOB
         For Add/Term defaults to 'Provider' unless specific attribute mentioned
         """
-        return self._analyze_transaction_attribute_context(text)
+        explicit_attr = self._extract_explicit_transaction_attribute(text, text_lower)
+        if explicit_attr:
+            return explicit_attr
+        
+        return self._analyze_transaction_attribute_context(text, text_lower)
     
-    def _extract_explicit_transaction_attribute(self, text: str) -> Optional[str]:
+    def _extract_explicit_transaction_attribute(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """Extract explicitly stated transaction attributes from email content"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        patterns = [
-            r'transaction\s+attribute\s*:\s*([^\n\r]+)',
-            r'attribute\s*:\s*([^\n\r]+)',
-            r'changed\s+attribute\s*:\s*([^\n\r]+)',
-            r'update\s+type\s*:\s*([^\n\r]+)'
-        ]
+        if not any(anchor in text_lower for anchor in _EXPLICIT_ATTRIBUTE_ANCHORS):
+            return None
         
-        for pattern in patterns:
-            import re
-            match = re.search(pattern, text_lower)
+        for pattern in _EXPLICIT_ATTRIBUTE_RES:
+            match = pattern.search(text_lower)
             if match:
                 attr_value = match.group(1).strip()
                 
-                attr_mappings = {
-                    'not applicable': 'Not Applicable',
-                    'n/a': 'Not Applicable', 
-                    'na': 'Not Applicable',
-                    'none': 'Not Applicable',
-                    'address': 'Address',
-                    'location': 'Address',
-                    'specialty': 'Specialty',
-                    'specialization': 'Specialty',
-                    'phone': 'Phone Number',
-                    'phone number': 'Phone Number',
-                    'telephone': 'Phone Number',
-                    'contact': 'Phone Number',
-                    'ppg': 'PPG',
-                    'ppg id': 'PPG',
-                    'practice group': 'PPG',
-                    'lob': 'LOB',
-                    'line of business': 'LOB',
-                    'network': 'LOB',
-                    'provider': 'Provider',
-                    'general': 'Provider',
-                    'demographic': 'Provider'
-                }
-                
-                for key, standard_value in attr_mappings.items():
+                for key, standard_value in _ATTRIBUTE_MAPPINGS.items():
                     if key in attr_value:
                         return standard_value
                 
@@ -297,120 +630,38 @@ class ExtractionEngine:
         
         return None
     
-    def _analyze_transaction_attribute_context(self, text: str) -> str:
+    def _analyze_transaction_attribute_context(self, text: str, text_lower: Optional[str] = None) -> str:
         """
         Advanced contextual analysis to determine which attribute is being changed
         Uses weighted scoring and context patterns to identify the primary attribute
         """
-        text_lower = text.lower()
-        
-        attribute_scores = {
-            'Address': 0,
-            'Specialty': 0, 
-            'Phone Number': 0,
-            'PPG': 0,
-            'LOB': 0,
-            'Provider': 0
-        }
+        if text_lower is None:
+            text_lower = text.lower()
         
-        context_patterns = {
-            'Address': {
-                'explicit': [  
-                    ('address change', 3.0), ('address update', 3.0), ('location change', 3.0),
-                    ('office change', 3.0), ('practice location', 2.8), ('new address', 2.5),
-                    ('relocate', 2.5), ('relocation', 2.5), ('move', 2.3), ('transfer', 2.0)
-                ],
-                'contextual': [ 
-                    ('address', 1.5), ('location', 1.2), ('street', 1.8), ('suite', 1.8),
-                    ('building', 1.5), ('zip', 1.8), ('city', 1.0), ('state', 0.8)
-                ],
-                'subjects': [  
-                    (r'address.*change', 2.5), (r'location.*update', 2.5), (r'move.*office', 2.0)
-                ]
-            },
-            'Specialty': {
-                'explicit': [
-                    ('specialty change', 3.0), ('specialty update', 3.0), ('specialization change', 2.8),
-                    ('practice change', 2.5), ('field change', 2.5), ('new specialty', 2.3)
-                ],
-                'contextual': [
-                    ('specialty', 1.8), ('specialization', 1.5), ('practice area', 1.5),
-                    ('medical field', 1.3), ('discipline', 1.2), ('board certified', 1.0)
-                ],
-                'subjects': [
-                    (r'specialty.*change', 2.5), (r'practice.*update', 2.0)
-                ]
-            },
-            'Phone Number': {
-                'explicit': [
-                    ('phone change', 3.0), ('phone update', 3.0), ('contact change', 2.8),
-                    ('phone number change', 3.2), ('telephone change', 3.0), ('fax change', 2.8),
-                    ('contact update', 2.5), ('new phone', 2.3), ('new contact', 2.0)
-                ],
-                'contextual': [
-                    ('phone', 1.8), ('telephone', 1.5), ('fax', 1.5), ('contact', 1.2),
-                    ('number', 1.0)
-                ],
-                'subjects': [
-                    (r'phone.*change', 2.5), (r'contact.*update', 2.5), (r'fax.*change', 2.5)
-                ]
-            },
-            'PPG': {
-                'explicit': [
-                    ('ppg change', 3.0), ('ppg update', 3.0), ('group change', 2.5),
-                    ('practice group change', 3.2), ('ppg id change', 3.0), ('new ppg', 2.3)
-                ],
-                'contextual': [
-                    ('ppg', 2.0), ('practice group', 1.8), ('group id', 1.5), ('ppg id', 2.0)
-                ],
-                'subjects': [
-                    (r'ppg.*change', 2.5), (r'group.*update', 2.0)
-                ]
-            },
-            'LOB': {
-                'explicit': [
-                    ('lob change', 3.0), ('network change', 2.8), ('line of business change', 3.2),
-                    ('plan change', 2.5), ('coverage change', 2.5), ('insurance change', 2.3)
-                ],
-                'contextual': [
-                    ('line of business', 2.0), ('lob', 1.8), ('network', 1.5), ('medicare', 1.3),
-                    ('commercial', 1.3), ('medicaid', 1.3), ('insurance', 1.2), ('plan', 1.0)
-                ],
-                'subjects': [
-                    (r'lob.*change', 2.5), (r'network.*update', 2.5), (r'plan.*change', 2.0)
-                ]
-            },
-            'Provider': {
-                'explicit': [ 
-                    ('provider change', 2.0), ('provider update', 2.0), ('provider information', 1.8),
-                    ('demographic change', 2.2), ('information update', 1.5)
-                ],
-                'contextual': [
-                    ('provider', 1.0), ('doctor', 0.8), ('physician', 0.8), ('demographic', 1.2),
-                    ('information', 0.5), ('data', 0.5)
-                ],
-                'subjects': [
-                    (r'provider.*update', 2.0), (r'information.*change', 1.5)
-                ]
-            }
-        }
+        scores = [0.0] * len(_ATTRIBUTES)
         
-        for attribute, patterns in context_patterns.items():
-            for phrase, weight in patterns['explicit']:
-                if phrase in text_lower:
-                    attribute_scores[attribute] += weight
-            
-            for phrase, weight in patterns['contextual']:
-                if phrase in text_lower:
-                    attribute_scores[attribute] += weight
-            
-            first_100_chars = text_lower[:100]
-            for pattern, weight in patterns['subjects']:
-                import re
-                if re.search(pattern, first_100_chars):
-                    attribute_scores[attribute] += weight * 1.2 
+        for hits in _ATTRIBUTE_EXPLICIT_SCANNER.find_all(text_lower).values():
+            for idx, weight in hits:
+                scores[idx] += weight
+        
+        # Stop early when no other attribute can close the gap to within the conflict margin
+        top_idx = max(range(len(scores)), key=scores.__getitem__)
+        if all(
+            scores[top_idx] - scores[idx] - _ATTRIBUTE_SCORE_BOUNDS[idx] >= 1.0
+            for idx in range(len(scores)) if idx != top_idx
+        ):
+            return _ATTRIBUTES[top_idx]
+        
+        for hits in _ATTRIBUTE_CONTEXTUAL_SCANNER.find_all(text_lower).values():
+            for idx, weight in hits:
+                scores[idx] += weight
         
-        top_scores = sorted(attribute_scores.items(), key=lambda x: x[1], reverse=True)
+        first_100_chars = text_lower[:100]
+        for idx, pattern, weight in _ATTRIBUTE_SUBJECT_RES:
+            if pattern.search(first_100_chars):
+                scores[idx] += weight
+        
+        top_scores = sorted(zip(_ATTRIBUTES, scores), key=lambda x: x[1], reverse=True)
         
         if top_scores[0][1] > 0:
             primary_attribute = top_scores[0][0]
@@ -431,21 +682,11 @@ class ExtractionEngine:
     
     def _resolve_attribute_conflict(self, text_lower: str, attr1: str, attr2: str, score1: float, score2: float) -> str:
         """Resolve conflicts when multiple attributes have similar scores"""
-        
-        strong_indicators = {
-            'Address': ['street', 'suite', 'zip code', 'city', 'state', 'building', 'floor'],
-            'Specialty': ['board certified', 'residency', 'fellowship', 'medical school', 'practice area'],
-            'Phone Number': ['extension', 'ext', 'area code', 'toll free', 'direct line'],
-            'PPG': ['group number', 'practice id', 'group code'],
-            'LOB': ['effective date', 'coverage', 'eligibility', 'enrollment'],
-            'Provider': ['credentials', 'license', 'certification', 'npi', 'name change']
-        }
-        
         score_adjustments = {attr1: 0, attr2: 0}
         
         for attr in [attr1, attr2]:
-            if attr in strong_indicators:
-                for indicator in strong_indicators[attr]:
+            if attr in _ATTRIBUTE_STRONG_INDICATORS:
+                for indicator in _ATTRIBUTE_STRONG_INDICATORS[attr]:
                     if indicator in text_lower:
                         score_adjustments[attr] += 0.5
         
@@ -454,333 +695,261 @@ class ExtractionEngine:
         
         return attr1 if final_score1 >= final_score2 else attr2
     
-    def _extract_term_reason(self, text: str) -> str:
+    def _extract_term_reason(self, text: str, text_lower: Optional[str] = None) -> str:
         """Enhanced termination reason extraction with comprehensive patterns"""
-        text_lower = text.lower()
-        
-        reason_patterns = [
-            (['voluntary', 'voluntarily', 'by choice', 'provider choice', 'own choice'], 'Voluntary'),
-            (['retired', 'retirement', 'retiring', 'end of career'], 'Retired'),
-            (['contract end', 'contract ended', 'contract expir', 'agreement end', 'term of contract'], 'Contract Ended'),
-            (['non-renewal', 'not renewed', 'renewal denied'], 'Contract Not Renewed'),
-            (['performance', 'quality concern', 'quality issue', 'disciplinary'], 'Performance Issues'),
-            (['credentialing', 'credential', 'licensing issue', 'license problem'], 'Credentialing Issues'),
-            (['relocat', 'relocation', 'moved', 'moving', 'geographic', 'out of area'], 'Relocation'),
-            (['business', 'financial', 'practice sold', 'practice closed', 'consolidation'], 'Business Decision'),
-            (['deceased', 'death', 'disability', 'unable to practice'], 'Death/Disability'),
-            (['network change', 'panel', 'network restructur', 'plan change'], 'Network Changes'),
-            (['involuntary', 'terminated', 'dismissal', 'termination'], 'Involuntary'),\
-            (['administrative', 'clerical', 'other'], 'Other')
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for keywords, reason_label in reason_patterns:
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return reason_label
-        
-        reason_context_patterns = [
-            r'reason[:\s]+([^,.\n]+)',
-            r'term(?:ination)?\s+reason[:\s]+([^,.\n]+)', 
-            r'due\s+to[:\s]+([^,.\n]+)',
-            r'because\s+of[:\s]+([^,.\n]+)',
-            r'result\s+of[:\s]+([^,.\n]+)'
-        ]
+        hits = _TERM_REASON_SCANNER.find_all(text_lower)
+        if hits:
+            best = min(priority for priorities in hits.values() for priority in priorities)
+            return _TERM_REASON_KEYWORDS[best][1]
         
-        for pattern in reason_context_patterns:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
+        for pattern in _REASON_CONTEXT_PATTERNS:
+            for match in pattern.finditer(text_lower):
                 reason_text = match.group(1).strip()
                 mapped_reason = self._map_reason_text(reason_text)
-                if mapped_reason != "Information not found":
+                if mapped_reason is not _NOT_FOUND:
                     return mapped_reason
         
-        return 'Information not found'
+        return _NOT_FOUND
     
     def _map_reason_text(self, reason_text: str) -> str:
         """Map extracted reason text to standardized categories"""
-        reason_lower = reason_text.lower()
-        
-        if any(word in reason_lower for word in ['voluntary', 'choice']):
-            return 'Voluntary'
-        elif any(word in reason_lower for word in ['retired', 'retirement']):
-            return 'Retired'
-        elif any(word in reason_lower for word in ['contract', 'agreement']):
-            return 'Contract Ended'
-        elif any(word in reason_lower for word in ['relocation', 'moved', 'moving']):
-            return 'Relocation'
-        elif any(word in reason_lower for word in ['performance', 'quality']):
-            return 'Performance Issues'
+        category = _match_category(_REASON_CATEGORY_RE, reason_text.lower(), _REASON_CATEGORIES)
+        
+        if category:
+            return category
         elif len(reason_text.strip()) > 2: 
             return reason_text.strip().title()
         else:
-            return 'Information not found'
+            return _NOT_FOUND
 
     
-    def _extract_transaction_type_smart(self, full_text: str) -> str:
+    def _email_cached(self, email_cache: Optional[Dict[str, list]], extract: Callable, full_text: str) -> list:
+        """Run an NER or pattern extractor on the whole email text at most once per email"""
+        if email_cache is None:
+            return extract(full_text)
+        key = extract.__qualname__
+        candidates = email_cache.get(key)
+        if candidates is None:
+            candidates = email_cache[key] = extract(full_text)
+        return candidates
+    
+    def _extract_transaction_type_smart(self, full_text: str, email_cache: Optional[Dict] = None) -> str:
         """Extract transaction type from full email content only"""
-        candidates = self.ner_extractor.extract_transaction_types(full_text)
-        return candidates[0].value if candidates else "Information not found"
+        candidates = self._email_cached(email_cache, self.ner_extractor.extract_transaction_types, full_text)
+        return candidates[0].value if candidates else _NOT_FOUND
     
-    def _extract_provider_name_smart(self, table_candidates: Dict, block_text: str, full_text: str) -> str:
+    def _first_candidate_value(self, sources: tuple, index: int = 0) -> str:
+        """
+        Value of the candidate at index from the first source that has one.
+        Sources are (extractor, argument) pairs tried in order, so later extractors only run on a miss.
+        """
+        for extract, argument in sources:
+            candidates = extract(argument)
+            if candidates and len(candidates) > index:
+                return candidates[index].value
+        return _NOT_FOUND
+    
+    def _extract_provider_name_smart(self, table_candidates: Dict, block_text: str, full_text: str, email_cache: Optional[Dict] = None) -> str:
         """Provider Name: Tables → Block NER → Email patterns"""
-        if 'provider_name' in table_candidates and table_candidates['provider_name']:
-            return table_candidates['provider_name'][0].value
-        
-        block_candidates = self.ner_extractor.extract_provider_names(block_text)
-        if block_candidates:
-            return block_candidates[0].value
-        
-        email_candidates = self.ner_extractor.extract_provider_names(full_text)
-        return email_candidates[0].value if email_candidates else "Information not found"
+        return self._first_candidate_value((
+            (table_candidates.get, 'provider_name'),
+            (self.ner_extractor.extract_provider_names, block_text),
+            (partial(self._email_cached, email_cache, self.ner_extractor.extract_provider_names), full_text)
+        ))
     
-    def _extract_npi_smart(self, table_candidates: Dict, full_text: str, block_text: str) -> str:
+    def _extract_npi_smart(self, table_candidates: Dict, full_text: str, block_text: str, email_cache: Optional[Dict] = None) -> str:
         """NPI: Tables → Email patterns → Block patterns"""
-        if 'npi' in table_candidates and table_candidates['npi']:
-            return table_candidates['npi'][0].value
-        
-        email_candidates = self.pattern_extractor.extract_npi_candidates(full_text)
-        if email_candidates:
-            return email_candidates[0].value
-        
-        block_candidates = self.pattern_extractor.extract_npi_candidates(block_text)
-        return block_candidates[0].value if block_candidates else "Information not found"
-    
-    def _extract_tin_smart(self, full_text: str, table_candidates: Dict, block_text: str) -> str:
+        extract = self._extract_npi_candidates
+        return self._first_candidate_value((
+            (table_candidates.get, 'npi'),
+            (partial(self._email_cached, email_cache, extract), full_text),
+            (extract, block_text)
+        ))
+    
+    def _extract_npi_candidates(self, text: str) -> list:
+        """Pattern NPI candidates; Provider NPI reads the first and Group NPI the second"""
+        return self.pattern_extractor.extract_npi_candidates(text, max_candidates=2)
+    
+    def _extract_tin_smart(self, full_text: str, table_candidates: Dict, block_text: str, email_cache: Optional[Dict] = None) -> str:
         """TIN: Email patterns → Tables → Block patterns"""
-        email_candidates = self.pattern_extractor.extract_tin_candidates(full_text)
-        if email_candidates:
-            return email_candidates[0].value
-        
-        if 'tin' in table_candidates and table_candidates['tin']:
-            return table_candidates['tin'][0].value
-        
-        block_candidates = self.pattern_extractor.extract_tin_candidates(block_text)
-        return block_candidates[0].value if block_candidates else "Information not found"
-    
-    def _extract_dates_smart(self, table_candidates: Dict, full_text: str, block_text: str, transaction_type: str) -> tuple:
+        extract = self.pattern_extractor.extract_tin_candidates
+        return self._first_candidate_value((
+            (partial(self._email_cached, email_cache, extract), full_text),
+            (table_candidates.get, 'tin'),
+            (extract, block_text)
+        ))
+    
+    def _extract_dates_smart(
+        self,
+        table_candidates: Dict,
+        full_text: str,
+        block_text: str,
+        transaction_type: str,
+        email_cache: Optional[Dict] = None
+    ) -> tuple:
         """Dates: Tables → Email patterns → Block NER"""
-        effective_date = "Information not found"
-        term_date = "Information not found"
-        
-        if 'term_date' in table_candidates and table_candidates['term_date']:
-            term_date = table_candidates['term_date'][0].value
-        
-        if 'dates' in table_candidates and table_candidates['dates'] and term_date == "Information not found":
-            date_value = table_candidates['dates'][0].value
-            if transaction_type.lower() == 'term':
-                term_date = date_value
-            else:
-                effective_date = date_value
-        
-        if effective_date == "Information not found" and term_date == "Information not found":
-            email_pattern_candidates = self.pattern_extractor.extract_date_candidates(full_text)
-            email_ner_candidates = self.ner_extractor.extract_dates(full_text)
-            
-            all_email_candidates = email_pattern_candidates + email_ner_candidates
-            if all_email_candidates:
-                best_candidate = max(all_email_candidates, key=lambda x: x.confidence)
-                date_value = best_candidate.value
-                
-                if transaction_type.lower() == 'term':
-                    term_date = date_value
-                else:
-                    effective_date = date_value
-        
-        if effective_date == "Information not found" and term_date == "Information not found":
-            block_candidates = self.ner_extractor.extract_dates(block_text)
-            if block_candidates:
-                date_value = block_candidates[0].value
-                if transaction_type.lower() == 'term':
-                    term_date = date_value
-                else:
-                    effective_date = date_value
-        
-        return effective_date, term_date
-    
-    def _extract_term_reason_smart(self, full_text: str, table_candidates: Dict, block_text: str) -> str:
+        term_date_candidates = table_candidates.get('term_date')
+        if term_date_candidates:
+            return _NOT_FOUND, term_date_candidates[0].value
+        
+        date_value = self._find_date_value(table_candidates, full_text, block_text, email_cache)
+        
+        # A single date belongs to the term date for terminations, else it is the effective date
+        if transaction_type.lower() == 'term':
+            return _NOT_FOUND, date_value
+        return date_value, _NOT_FOUND
+    
+    def _find_date_value(
+        self,
+        table_candidates: Dict,
+        full_text: str,
+        block_text: str,
+        email_cache: Optional[Dict] = None
+    ) -> str:
+        """First date found from table dates, then the best email-wide candidate, then block NER"""
+        dates_candidates = table_candidates.get('dates')
+        if dates_candidates:
+            return dates_candidates[0].value
+        
+        email_pattern_candidates = self._email_cached(email_cache, self.pattern_extractor.extract_date_candidates, full_text)
+        email_ner_candidates = self._email_cached(email_cache, self.ner_extractor.extract_dates, full_text)
+        
+        all_email_candidates = email_pattern_candidates + email_ner_candidates
+        if all_email_candidates:
+            return max(all_email_candidates, key=_CONFIDENCE_GETTER).value
+        
+        block_candidates = self.ner_extractor.extract_dates(block_text)
+        return block_candidates[0].value if block_candidates else _NOT_FOUND
+    
+    def _extract_term_reason_smart(
+        self,
+        full_text: str,
+        table_candidates: Dict,
+        block_text: str,
+        full_text_lower: Optional[str] = None,
+        block_text_lower: Optional[str] = None
+    ) -> str:
         """Term Reason: Email patterns → Tables → Block patterns"""
-        email_reason = self._extract_term_reason(full_text)
-        if email_reason != "Information not found":
+        email_reason = self._extract_term_reason(full_text, full_text_lower)
+        if email_reason is not _NOT_FOUND:
             return email_reason
         
-        if 'term_reason' in table_candidates and table_candidates['term_reason']:
-            return table_candidates['term_reason'][0].value
+        term_reason_candidates = table_candidates.get('term_reason')
+        if term_reason_candidates:
+            return term_reason_candidates[0].value
         
-        return self._extract_term_reason(block_text)
+        return self._extract_term_reason(block_text, block_text_lower)
     
-    def _extract_specialty_smart(self, table_candidates: Dict, block_text: str, full_text: str) -> str:
+    def _extract_specialty_smart(self, table_candidates: Dict, block_text: str, full_text: str, email_cache: Optional[Dict] = None) -> str:
         """Specialties: Tables → Block NER → Email patterns"""
-        if 'specialty' in table_candidates and table_candidates['specialty']:
-            return table_candidates['specialty'][0].value
-        
-        block_candidates = self.ner_extractor.extract_specialties(block_text)
-        if block_candidates:
-            return block_candidates[0].value
-        
-        email_candidates = self.ner_extractor.extract_specialties(full_text)
-        return email_candidates[0].value if email_candidates else "Information not found"
+        return self._first_candidate_value((
+            (table_candidates.get, 'specialty'),
+            (self.ner_extractor.extract_specialties, block_text),
+            (partial(self._email_cached, email_cache, self.ner_extractor.extract_specialties), full_text)
+        ))
     
-    def _extract_organization_smart(self, full_text: str, block_text: str, table_candidates: Dict) -> str:
+    def _extract_organization_smart(self, full_text: str, block_text: str, table_candidates: Dict, email_cache: Optional[Dict] = None) -> str:
         """Organizations: Email patterns → Block NER → Tables"""
-        email_candidates = self.ner_extractor.extract_organizations(full_text)
-        if email_candidates:
-            return email_candidates[0].value
-        
-        block_candidates = self.ner_extractor.extract_organizations(block_text)
-        if block_candidates:
-            return block_candidates[0].value
-        
-        if 'organization' in table_candidates and table_candidates['organization']:
-            return table_candidates['organization'][0].value
-        
-        return "Information not found"
+        return self._first_candidate_value((
+            (partial(self._email_cached, email_cache, self.ner_extractor.extract_organizations), full_text),
+            (self.ner_extractor.extract_organizations, block_text),
+            (table_candidates.get, 'organization')
+        ))
     
-    def _extract_ppg_smart(self, full_text: str, table_candidates: Dict, block_text: str) -> str:
+    def _extract_ppg_smart(self, full_text: str, table_candidates: Dict, block_text: str, email_cache: Optional[Dict] = None) -> str:
         """PPG: Email patterns → Tables → Block patterns"""
-        email_candidates = self.pattern_extractor.extract_ppg_candidates(full_text)
-        if email_candidates:
-            return email_candidates[0].value
-        
-        if 'ppg' in table_candidates and table_candidates['ppg']:
-            return table_candidates['ppg'][0].value
-        
-        block_candidates = self.pattern_extractor.extract_ppg_candidates(block_text)
-        return block_candidates[0].value if block_candidates else "Information not found"
-    
-    def _extract_phone_smart(self, block_text: str, full_text: str) -> str:
+        extract = self.pattern_extractor.extract_ppg_candidates
+        return self._first_candidate_value((
+            (partial(self._email_cached, email_cache, extract), full_text),
+            (table_candidates.get, 'ppg'),
+            (extract, block_text)
+        ))
+    
+    def _extract_phone_smart(self, block_text: str, full_text: str, email_cache: Optional[Dict] = None) -> str:
         """Phone: Block patterns → Email patterns"""
-        block_candidates = self.pattern_extractor.extract_phone_candidates(block_text)
-        if block_candidates:
-            return block_candidates[0].value
-        
-        email_candidates = self.pattern_extractor.extract_phone_candidates(full_text)
-        return email_candidates[0].value if email_candidates else "Information not found"
+        extract = self.pattern_extractor.extract_phone_candidates
+        return self._first_candidate_value((
+            (extract, block_text),
+            (partial(self._email_cached, email_cache, extract), full_text)
+        ))
     
-    def _extract_fax_smart(self, table_candidates: Dict, block_text: str, full_text: str) -> str:
+    def _extract_fax_smart(self, table_candidates: Dict, block_text: str, full_text: str, email_cache: Optional[Dict] = None) -> str:
         """Fax: Tables → Block patterns → Email patterns"""
-        if 'fax' in table_candidates and table_candidates['fax']:
-            return table_candidates['fax'][0].value
-        
-        block_candidates = self.pattern_extractor.extract_fax_candidates(block_text)
-        if block_candidates:
-            return block_candidates[0].value
-        
-        email_candidates = self.pattern_extractor.extract_fax_candidates(full_text)
-        return email_candidates[0].value if email_candidates else "Information not found"
-    
-    def _extract_license_smart(self, block_text: str, full_text: str, table_candidates: Dict) -> str:
+        extract = self.pattern_extractor.extract_fax_candidates
+        return self._first_candidate_value((
+            (table_candidates.get, 'fax'),
+            (extract, block_text),
+            (partial(self._email_cached, email_cache, extract), full_text)
+        ))
+    
+    def _extract_license_smart(self, block_text: str, full_text: str, table_candidates: Dict, email_cache: Optional[Dict] = None) -> str:
         """License: Block patterns → Email patterns → Tables"""
-        block_candidates = self.pattern_extractor.extract_license_candidates(block_text)
-        if block_candidates:
-            return block_candidates[0].value
-        
-        email_candidates = self.pattern_extractor.extract_license_candidates(full_text)
-        if email_candidates:
-            return email_candidates[0].value
-        
-        if 'license' in table_candidates and table_candidates['license']:
-            return table_candidates['license'][0].value
-        
-        return "Information not found"
-    
-    def _extract_lob_smart(self, full_text: str, block_text: str) -> str:
+        extract = self.pattern_extractor.extract_license_candidates
+        return self._first_candidate_value((
+            (extract, block_text),
+            (partial(self._email_cached, email_cache, extract), full_text),
+            (table_candidates.get, 'license')
+        ))
+    
+    def _extract_lob_smart(self, full_text: str, block_text: str, email_cache: Optional[Dict] = None) -> str:
         """Line of Business: Email patterns → Block NER"""
-        email_candidates = self.ner_extractor.extract_line_of_business(full_text)
+        email_candidates = self._email_cached(email_cache, self.ner_extractor.extract_line_of_business, full_text)
         if email_candidates:
-            lobs = [c.value for c in email_candidates]
-            return ", ".join(lobs)
+            return ", ".join(map(_VALUE_GETTER, email_candidates))
+        
+        # A block spanning the whole email would just repeat the miss above
+        if block_text is full_text or block_text == full_text:
+            return _NOT_FOUND
         
         block_candidates = self.ner_extractor.extract_line_of_business(block_text)
         if block_candidates:
-            lobs = [c.value for c in block_candidates]
-            return ", ".join(lobs)
+            return ", ".join(map(_VALUE_GETTER, block_candidates))
         
-        return "Information not found"
+        return _NOT_FOUND
     
-    def _extract_transaction_attribute_smart(self, transaction_type: str, full_text: str) -> str:
+    def _extract_transaction_attribute_smart(
+        self,
+        transaction_type: str,
+        full_text: str,
+        full_text_lower: Optional[str] = None
+    ) -> str:
         """Transaction Attribute based on transaction type and context"""
-        explicit_attr = self._extract_explicit_transaction_attribute(full_text)
+        if full_text_lower is None:
+            full_text_lower = full_text.lower()
+        
+        explicit_attr = self._extract_explicit_transaction_attribute(full_text, full_text_lower)
         if explicit_attr:
             return explicit_attr
         
-        transaction_type_lower = transaction_type.lower()
-        
-        if transaction_type_lower == 'term':
-            full_text_lower = full_text.lower()
-            
-            explicit_attr_terminations = [
-                'address termination', 'phone termination', 'ppg termination', 
-                'lob termination', 'terminate address only', 'terminate phone only',
-                'terminate ppg only', 'terminate lob only', 'specialty termination'
-            ]
-            
-            for phrase in explicit_attr_terminations:
-                if phrase in full_text_lower:
-                    if 'address' in phrase:
-                        return 'Address'
-                    elif 'specialty' in phrase:
-                        return 'Specialty'
-                    elif 'phone' in phrase:
-                        return 'Phone Number'
-                    elif 'ppg' in phrase:
-                        return 'PPG'
-                    elif 'lob' in phrase:
-                        return 'LOB'
-            
-            return 'Provider'
-            
-        elif transaction_type_lower == 'add':
-            full_text_lower = full_text.lower()
-            
-            explicit_attr_additions = [
-                'add new address to', 'add new specialty to', 'add new phone to',
-                'add new ppg to', 'add new lob to', 'include new address in',
-                'include new specialty in', 'include new phone in'
-            ]
-            
-            for phrase in explicit_attr_additions:
-                if phrase in full_text_lower:
-                    if 'address' in phrase:
-                        return 'Address'
-                    elif 'specialty' in phrase:
-                        return 'Specialty'
-                    elif 'phone' in phrase:
-                        return 'Phone Number'
-                    elif 'ppg' in phrase:
-                        return 'PPG'
-                    elif 'lob' in phrase:
-                        return 'LOB'
-            
-            return 'Provider'
-        elif transaction_type_lower == 'update':
-            return self._extract_transaction_attribute(full_text)
-        else:
+        handler = self._transaction_attribute_handlers.get(transaction_type.lower())
+        if handler is None:
             return "Not Applicable"
+        return handler(full_text, full_text_lower)
+    
+    def _phrase_transaction_attribute(self, scanner: PhraseScanner, full_text: str, full_text_lower: str) -> str:
+        """Attribute of the highest-priority phrase present, 'Provider' when none is"""
+        hits = scanner.find_all(full_text_lower)
+        if hits:
+            _, attribute = min(hit for phrase_hits in hits.values() for hit in phrase_hits)
+            return attribute
+        return 'Provider'
     
-    def _extract_address_smart(self, table_candidates: Dict, block_text: str, full_text: str) -> str:
-        if 'address' in table_candidates and table_candidates['address']:
-            return table_candidates['address'][0].value
-        
-        return "Information not found"
+    def _extract_address_smart(self, table_candidates: Dict) -> str:
+        address_candidates = table_candidates.get('address')
+        return address_candidates[0].value if address_candidates else _NOT_FOUND
     
-    def _extract_group_npi_smart(self, table_candidates: Dict, full_text: str, block_text: str) -> str:
-        """Group NPI: Tables → Email patterns → Block patterns"""
-        if 'npi' in table_candidates and len(table_candidates['npi']) > 1:
-            return table_candidates['npi'][1].value
-        
-        email_candidates = self.pattern_extractor.extract_npi_candidates(full_text)
-        if len(email_candidates) > 1:
-            return email_candidates[1].value
-        
-        block_candidates = self.pattern_extractor.extract_npi_candidates(block_text)
-        if len(block_candidates) > 1:
-            return block_candidates[1].value
-        
-        return "Information not found"
+    def _extract_group_npi_smart(self, table_candidates: Dict, full_text: str, block_text: str, email_cache: Optional[Dict] = None) -> str:
+        """Group NPI: Tables → Email patterns → Block patterns (second candidate of each)"""
+        extract = self._extract_npi_candidates
+        return self._first_candidate_value((
+            (table_candidates.get, 'npi'),
+            (partial(self._email_cached, email_cache, extract), full_text),
+            (extract, block_text)
+        ), index=1)
     
     def _create_empty_result(self) -> Dict[str, str]:
         """Create empty result with all fields set to 'Information not found'"""
-        result = {}
-        for field in self.output_fields:
-            result[field] = "Information not found"
-        return result
\ No newline at end of file
+        return self._empty_output_template.copy()
\ No newline at end of file
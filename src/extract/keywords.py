@@ -0,0 +1,73 @@
+"""
+Multi-phrase keyword scanning used by the extraction heuristics
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+class PhraseScanner:
+    """
+    Find which phrases from a fixed set occur in a text.
+    Uses a single Aho-Corasick pass when pyahocorasick is installed,
+    otherwise a compiled alternation of all phrases rejects texts with no
+    hit in one C-level scan before the per-phrase substring checks.
+    """
+
+    def __init__(self, phrases: Iterable[Tuple[str, Any]]):
+        self.payloads: Dict[str, List[Any]] = {}
+        for phrase, payload in phrases:
+            self.payloads.setdefault(phrase, []).append(payload)
+
+        self._automaton = None
+        self._any_phrase_re = None
+        if not HAS_AHOCORASICK and self.payloads and '' not in self.payloads:
+            self._any_phrase_re = re.compile('|'.join(
+                re.escape(phrase) for phrase in sorted(self.payloads, key=len, reverse=True)
+            ))
+        if HAS_AHOCORASICK and any(self.payloads):
+            automaton = ahocorasick.Automaton()
+            for phrase in self.payloads:
+                if phrase:
+                    automaton.add_word(phrase, phrase)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find_all(self, text: str) -> Dict[str, List[Any]]:
+        """Return {phrase: payloads} for every phrase present in text (each phrase once)"""
+        if self._automaton is None:
+            if self._any_phrase_re is not None and not self._any_phrase_re.search(text):
+                return {}
+            return {phrase: payloads for phrase, payloads in self.payloads.items() if phrase in text}
+
+        # An empty phrase is contained in every text, matching the 'in' fallback
+        found = {'': self.payloads['']} if '' in self.payloads else {}
+        for _, phrase in self._automaton.iter(text):
+            if phrase not in found:
+                found[phrase] = self.payloads[phrase]
+        return found
+
+    def find_first(self, text: str) -> Dict[str, int]:
+        """Return {phrase: start of its first occurrence} for every phrase present in text"""
+        if self._automaton is None:
+            if self._any_phrase_re is not None and not self._any_phrase_re.search(text):
+                return {}
+            found = {}
+            for phrase in self.payloads:
+                position = text.find(phrase)
+                if position >= 0:
+                    found[phrase] = position
+            return found
+
+        # Matches come out ordered by end offset, so a phrase's first hit is its earliest one
+        found = {'': 0} if '' in self.payloads else {}
+        for end, phrase in self._automaton.iter(text):
+            if phrase not in found:
+                found[phrase] = end - len(phrase) + 1
+        return found
@@ -1,61 +1,355 @@
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
+import threading
+from functools import lru_cache
+from operator import attrgetter
+import numpy as np
 import yaml
 from pathlib import Path
-import spacy
-from spacy.matcher import Matcher
-from spacy.lang.en import English
 from .patterns import ExtractionCandidate
+from .keywords import PhraseScanner
 from dateutil import parser as date_parser
 
 # Optional spaCy import with graceful fallback
 try:
     import spacy
-    from spacy.matcher import Matcher
+    from spacy.matcher import Matcher, PhraseMatcher
     from spacy.lang.en import English
     HAS_SPACY = True
 except ImportError:
     HAS_SPACY = False
 
+# Only tokenization, NER and the Matcher (LOWER/IS_PUNCT attributes) are used;
+# the dependency parser, tagger and lemmatizer are never consulted
+SPACY_EXCLUDED_PIPES = ["parser", "tagger", "attribute_ruler", "lemmatizer", "senter"]
+
+# Stock pipelines tried in order for each model preference. The transformer is the most
+# accurate but by far the slowest; the small CNN pipeline trades some NER recall for
+# much lower latency, which the rule-based post-processing largely absorbs.
+SPACY_MODEL_PREFERENCES = {
+    "auto": ("en_core_web_trf", "en_core_web_sm"),
+    "trf": ("en_core_web_trf",),
+    "sm": ("en_core_web_sm",),
+}
+
+# libyaml's C loader when PyYAML was built with it; same safe subset of YAML
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Loaded pipelines shared by every NERExtractor in the process, keyed by
+# (model, model_preference, prefer_gpu); loading a model takes seconds
+_PIPELINE_CACHE = {}
+_PIPELINE_CACHE_LOCK = threading.Lock()
+
+# Line classifiers for locating the email body; salutations and closings are one alternation each
+_SALUTATION_RE = re.compile('|'.join([
+    r'^dear\s+', r'^hi\s*,?$', r'^hello\s*,?$', r'^greetings\s*,?$',
+    r'^to\s+whom', r'^attention', r'^regarding'
+]))
+_CLOSING_RE = re.compile('|'.join([
+    r'^best\s+(regards?|wishes)', r'^sincerely', r'^thank\s+you',
+    r'^regards?$', r'^thanks?$', r'^cheers?$', r'^yours?\s+',
+    r'^respectfully', r'^cordially'
+]))
+# Every closing starts with one of these words; texts without any skip the backward line scan
+_CLOSING_HINT_RE = re.compile(r'best|sincerely|thank|regard|cheer|your|respectfully|cordially', re.IGNORECASE)
+_HEADER_LINE_RE = re.compile(r'^(from|to|subject|date|received):')
+_LABEL_LINE_RE = re.compile(r'^[a-z\s,&]+:$')
+
+_TABLE_PIPE_RE = re.compile(r'\s+\|\s+')
+_TABLE_FIELD_PIPE_RE = re.compile(r'\w+:\s*\w+\s*\|\s*\w+:')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_ORG_EXPANSION_RE = re.compile(r'\s*&\s+([A-Z][A-Z\s&]+)')
+_CONFIDENCE_GETTER = attrgetter('confidence')
+# Organization name cleanup in one substitution: a leading "the", a trailing date clause
+# (with any punctuation before it) and trailing punctuation
+_ORG_CLEAN_RE = re.compile(
+    r'^the\s+|[.,;:\s]*\s+(?:effective|on|as\s+of).*$|[.,;:\s]+$', re.IGNORECASE
+)
+# Names that are really a date word, a date or one or two letters
+_ORG_SKIP_RE = re.compile(
+    r'^(?:(?:effective|on|as\s+of|date|time)'
+    r'|\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}'
+    r'|(?:january|february|march|april|may|june|july|august|september|october|november|december)'
+    r'|\w{1,2})$',
+    re.IGNORECASE
+)
+
+
+
+def _any_term_re(terms: List[str]) -> re.Pattern:
+    """One alternation whose search() is true exactly when any term is a substring"""
+    return re.compile('|'.join(re.escape(term) for term in terms))
+
+
+# Organization keyword sets; each is searched in one pass over the lowercased name/context
+_HEALTHCARE_TERM_RE = _any_term_re([
+    'medical', 'clinic', 'hospital', 'practice', 'physicians',
+    'health', 'healthcare', 'group', 'associates', 'center'
+])
+_NON_HEALTHCARE_TERM_RE = _any_term_re([
+    'microsoft', 'google', 'email', 'outlook', 'exchange',
+    'best regards', 'thank you', 'sincerely'
+])
+_ACRONYM_ORG_RE = re.compile(r'^[A-Z]+(\s*&\s*[A-Z]+)*$')
+_ORG_CONFIDENCE_FACILITY_RE = _any_term_re(['medical', 'clinic', 'hospital', 'practice'])
+_ORG_CONFIDENCE_CONTEXT_RE = _any_term_re(['terminated with', 'affiliated with', 'practices at'])
+_ORG_CONFIDENCE_GROUP_RE = _any_term_re(['group', 'associates', 'partners'])
+_BAD_ORG_TERM_RE = _any_term_re([
+    'provider', 'affiliation', 'network', 'best regards', 'hi', 'please',
+    'terminate', 'effective', 'date', 'tax id', 'license', 'npi'
+])
+_PROVIDER_CONTEXT_RE = _any_term_re([
+    'medical group', 'medical center', 'clinic', 'hospital', 'practice',
+    'physicians', 'associates', 'health system', 'healthcare',
+    'terminated with', 'employed by', 'affiliated with', 'works at',
+    'practices at', 'joined', 'leaving'
+])
+_PROVIDER_ORG_TERM_RE = _any_term_re([
+    'medical', 'clinic', 'hospital', 'practice', 'physicians',
+    'health center', 'medical center', 'group', 'associates'
+])
+_HEALTH_PLAN_CONTEXT_RE = _any_term_re([
+    'insurance', 'health plan', 'hmo', 'ppo', 'epo', 'pos',
+    'medicare', 'medicaid', 'coverage', 'benefits', 'plan',
+    'payor', 'payer', 'insurer'
+])
+_HEALTH_PLAN_NAME_RE = _any_term_re([
+    'insurance', 'health plan', 'hmo', 'ppo', 'epo', 'pos',
+    'medicare', 'medicaid', 'coverage', 'benefits plan',
+    'health net', 'health care plan', 'managed care'
+])
+_PROVIDER_OVERRIDE_RE = _any_term_re([
+    'medical group', 'medical center', 'clinic', 'hospital',
+    'practice', 'physicians', 'health center', 'associates'
+])
+
+_MONTH_PATTERN = '|'.join([
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+    'jan', 'feb', 'mar', 'apr', 'may', 'jun',
+    'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
+])
+_WORD_DATE_RES = [re.compile(pattern, re.IGNORECASE) for pattern in [
+    # "22 September 2025"
+    rf'(\d{{1,2}})\s+({_MONTH_PATTERN})\s+(\d{{4}})',
+    # "September 22, 2025"
+    rf'({_MONTH_PATTERN})\s+(\d{{1,2}}),?\s+(\d{{4}})',
+    # "22nd September 2025"
+    rf'(\d{{1,2}})(?:st|nd|rd|th)?\s+({_MONTH_PATTERN})\s+(\d{{4}})',
+    # "September 2025" (month and year only)
+    rf'({_MONTH_PATTERN})\s+(\d{{4}})'
+]]
+
+# Phrase extractors for fuzzy specialty matching, one per keyword / context word. A single
+# lookahead scan finds which keywords occur (none is a prefix of another, so each position
+# names at most one) and only those patterns are run, still in list order.
+_FUZZY_MEDICAL_KEYWORDS = ['medicine', 'surgery', 'ology', 'ics', 'ist', 'ian', 'specialty', 'field']
+_FUZZY_KEYWORD_RES = [
+    re.compile(rf'(\w+(?:\s+\w+)*\s+{keyword}|\w*{keyword}\w*(?:\s+\w+)*)', re.IGNORECASE)
+    for keyword in _FUZZY_MEDICAL_KEYWORDS
+]
+_FUZZY_KEYWORD_HINT_RE = re.compile(
+    '(?=' + '|'.join(f'({keyword})' for keyword in _FUZZY_MEDICAL_KEYWORDS) + ')', re.IGNORECASE
+)
+_FUZZY_CONTEXT_WORDS = ['specialty', 'field', 'specialization', 'area', 'practice']
+_FUZZY_CONTEXT_RES = [
+    re.compile(rf'{word}[:\s]+([^,.\n]+)', re.IGNORECASE) for word in _FUZZY_CONTEXT_WORDS
+]
+_FUZZY_CONTEXT_HINT_RE = re.compile(
+    '(?=' + '|'.join(f'({word})' for word in _FUZZY_CONTEXT_WORDS) + ')', re.IGNORECASE
+)
+
+# Words near a DATE entity that mark it as a start or an end date
+_DATE_START_CONTEXT_RE = _any_term_re(['effective', 'start', 'begin'])
+_DATE_END_CONTEXT_RE = _any_term_re(['term', 'end', 'finish', 'expir'])
+
+# Word-date normalization, tried in this order
+_MONTH_MAP = {
+    'january': 1, 'jan': 1, 'february': 2, 'feb': 2,
+    'march': 3, 'mar': 3, 'april': 4, 'apr': 4,
+    'may': 5, 'june': 6, 'jun': 6,
+    'july': 7, 'jul': 7, 'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9, 'october': 10, 'oct': 10,
+    'november': 11, 'nov': 11, 'december': 12, 'dec': 12
+}
+_DIGIT_RE = re.compile(r'\d')
+_EFFECTIVE_DATE_RE = re.compile(r'effective\s+(\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4})', re.IGNORECASE)
+_DAY_MONTH_YEAR_RE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s+(\w+)\s+(\d{4})', re.IGNORECASE)
+_MONTH_DAY_YEAR_RE = re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE)
+_MONTH_YEAR_RE = re.compile(r'(\w+)\s+(\d{4})', re.IGNORECASE)
+
+_TAXONOMY_CODE_RE = re.compile(r'^[0-9]{3,4}[a-z]*[0-9]{4,}x$')
+
+# Transaction keywords, searched for in the lowercased text in list order, as (literal, pattern):
+# a str 'in' check on the literal skips the regex search for keywords that are absent
+_TERM_KEYWORD_RES = [(pattern.replace(r'\b', ''), re.compile(pattern)) for pattern in [
+    r'\bterminate\b', r'\bterminated\b', r'\btermination\b',
+    r'\bremove\b', r'\bdiscontinue\b', r'\bwithdraw\b',
+    r'\bcancel\b', r'\bexpire\b', r'\bcease\b', r'\bend\b',
+    r'\bstop\b', r'no longer'
+]]
+_UPDATE_KEYWORD_RES = [(pattern.replace(r'\b', ''), re.compile(pattern)) for pattern in [
+    r'\bupdate\b', r'\bmodify\b', r'\bchange\b', r'\brevise\b',
+    r'\bamend\b', r'\bcorrect\b', r'\bedit\b', r'\badjust\b',
+    r'\balter\b', r'\brefresh\b', r'\bmove\b', r'\brelocate\b'
+]]
+_ADD_KEYWORD_RES = [(pattern.replace(r'\b', ''), re.compile(pattern)) for pattern in [
+    r'\badd\b', r'\bnew\b', r'\binclude\b', r'\benroll\b',
+    r'\bregister\b', r'\bjoin\b', r'\bwelcome\b', r'\bonboard\b',
+    r'\brecruit\b', r'\bhire\b'
+]]
+# Keywords that mark a transaction type when they appear near the start (subject line)
+_SUBJECT_TRANSACTION_RES = {
+    trans_type: [re.compile(pattern) for pattern in patterns]
+    for trans_type, patterns in {
+        'Add': [r'new\s+provider', r'provider\s+enrollment', r'welcome', r'onboard'],
+        'Update': [r'address\s+change', r'update', r'change', r'modify', r'move'],
+        'Term': [r'termination', r'terminate', r'end', r'discontinue']
+    }.items()
+}
+
+# Phrases that state the transaction type outright, checked in order
+_EXPLICIT_TRANSACTION_PHRASES = {
+    'Term': [
+        'provider termination', 'terminate provider', 'provider term',
+        'discontinue provider', 'remove provider', 'end provider',
+        'provider withdrawal', 'cancel provider', 'provider departure'
+    ],
+    'Update': [
+        'address change', 'phone change', 'information change',
+        'provider update', 'update provider', 'modify provider',
+        'change provider', 'provider modification', 'address update',
+        'phone update', 'demographic change', 'contact change',
+        'location change', 'practice change', 'office change'
+    ],
+    'Add': [
+        'new provider', 'add provider', 'provider enrollment', 
+        'provider addition', 'include provider', 'onboard provider',
+        'welcome provider', 'provider registration', 'provider credentialing'
+    ]
+}
+_EXPLICIT_TRANSACTION_SCANNER = PhraseScanner(
+    (phrase, transaction_type)
+    for transaction_type, phrases in _EXPLICIT_TRANSACTION_PHRASES.items() for phrase in phrases
+)
+
+# Weighted indicators scored by _analyze_transaction_context; one scanner pass finds those present
+_TRANSACTION_CONTEXT_INDICATORS = {
+    'Update': {
+        'strong': [
+            ('effective date', 2.0), ('address change', 2.0), ('phone change', 2.0),
+            ('contact change', 2.0), ('location change', 2.0), ('move', 1.8),
+            ('relocate', 1.8), ('transfer', 1.5), ('modify', 1.5)
+        ],
+        'medium': [
+            ('change', 1.2), ('update', 1.2), ('revise', 1.0), ('correct', 1.0),
+            ('edit', 1.0), ('adjust', 1.0), ('alter', 1.0)
+        ],
+        'weak': [
+            ('different', 0.5), ('new address', 0.8), ('new phone', 0.8),
+            ('updated', 0.7), ('current', 0.3)
+        ]
+    },
+    'Add': {
+        'strong': [
+            ('new provider', 2.5), ('welcome', 2.0), ('enrollment', 2.0),
+            ('credentialing', 2.0), ('onboard', 1.8), ('recruit', 1.8),
+            ('joined our network', 2.2), ('joining our network', 2.2),
+            ('has joined', 2.0), ('will be joining', 2.0)
+        ],
+        'medium': [
+            ('new', 1.0), ('add', 1.2), ('include', 1.0), ('join', 1.2),
+            ('register', 1.2), ('enroll', 1.5), ('joined', 1.4), 
+            ('joining', 1.4), ('please add', 1.8)
+        ],
+        'weak': [
+            ('first time', 0.8), ('initial', 0.5), ('begin', 0.5)
+        ]
+    },
+    'Term': {
+        'strong': [
+            ('termination', 2.5), ('terminated', 2.0), ('departure', 2.0),
+            ('discontinue', 2.0), ('withdraw', 1.8), ('cease', 1.8),
+            ('no longer be associated', 2.2), ('will no longer', 2.0),
+            ('process the termination', 2.3)
+        ],
+        'medium': [
+            ('remove', 1.2), ('end', 1.0), ('stop', 1.2), ('cancel', 1.5),
+            ('expire', 1.3), ('no longer associated', 1.6)
+        ],
+        'weak': [
+            ('no longer', 1.5), ('final', 0.5), ('last', 0.3)
+        ]
+    }
+}
+# The same table flattened to (trans_type, indicator, weight) in scoring order; the scanner
+# yields indexes into it, so only the indicators present in a text are visited
+_TRANSACTION_CONTEXT_WEIGHTS = [
+    (trans_type, indicator, weight)
+    for trans_type, categories in _TRANSACTION_CONTEXT_INDICATORS.items()
+    for indicators in categories.values() for indicator, weight in indicators
+]
+_TRANSACTION_KEY_INDICATORS = {
+    trans_type: [indicator for indicator_type, indicator, _ in _TRANSACTION_CONTEXT_WEIGHTS if indicator_type == trans_type]
+    for trans_type in _TRANSACTION_CONTEXT_INDICATORS
+}
+_CONTEXT_INDICATOR_SCANNER = PhraseScanner(
+    (indicator, idx) for idx, (_, indicator, _) in enumerate(_TRANSACTION_CONTEXT_WEIGHTS)
+)
+
+_NAME_PATTERN_RES = [re.compile(pattern) for pattern in [
+    r'Dr\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]*\.?\s+)*[A-Z][a-z]+)',
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+M\.?D\.?',
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+D\.?O\.?',
+]]
+_NAME_DEGREE_SUFFIX_RE = re.compile(r',\s*(M\.?D\.?|D\.?O\.?)$', re.IGNORECASE)
+
 class NERExtractor:
     """
     Local ML/NER using spaCy with domain vocabulary
     Provides fuzzy extraction for names, organizations, specialties
     """
     
-    def __init__(self):
+    def __init__(self, model: Optional[str] = None, model_preference: str = "auto",
+                 prefer_gpu: bool = True):
+        """
+        model: optional spaCy pipeline name or path tried before the stock models,
+        e.g. a transformer pipeline exported with an INT8-quantized backbone
+        model_preference: which stock pipelines to try, a key of SPACY_MODEL_PREFERENCES
+        prefer_gpu: run the pipeline on a GPU when one is available, CPU otherwise
+        """
         global HAS_SPACY
+        if model_preference not in SPACY_MODEL_PREFERENCES:
+            raise ValueError(
+                f"Unknown model_preference {model_preference!r}, expected one of {sorted(SPACY_MODEL_PREFERENCES)}"
+            )
         self.logger = logging.getLogger(__name__)
         self.nlp = None
         self.matcher = None
+        self.phrase_matcher = None
+        # Recently parsed Docs keyed by text (least recently used evicted first),
+        # so repeated passes over the same text reuse one parse
+        self._doc_cache = {}
+        self._doc_cache_size = 8
+        self._doc_cache_lock = threading.Lock()
         
         if HAS_SPACY:
             try:
-                try:
-                    self.nlp = spacy.load("en_core_web_trf")
-                    self.logger.info("Loaded spaCy transformer model")
-                except OSError:
-                    try:
-                        self.nlp = spacy.load("en_core_web_sm")
-                        self.logger.info("Loaded spaCy small model")
-                    except OSError:
-                        self.logger.warning("No spaCy model available, using basic English")
-                        self.nlp = English()
-                        
+                self.nlp = self._get_pipeline(model, model_preference, prefer_gpu)
                 self.matcher = Matcher(self.nlp.vocab)
-                self._setup_domain_patterns()
+                self.phrase_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
                 
             except Exception as e:
                 self.logger.error(f"Failed to initialize spaCy: {e}")
                 HAS_SPACY = False
         
-        self.specialties_config = self._load_specialties_config()
+        config_key = self._specialties_config_key()
+        self.specialties_config = self._load_specialties_config(config_key)
         self.medical_specialties = list(self.specialties_config.keys()) if self.specialties_config else []
         
-        self.specialty_synonyms = self._build_specialty_synonyms()
-          
-        self.taxonomy_codes = self._build_taxonomy_mappings()
+        self.specialty_synonyms, self.taxonomy_codes = self._build_specialty_maps(config_key)
         
         self.organization_aliases = [
             "Medical Group", "Healthcare", "Clinic", "Practice", "Associates",
@@ -67,43 +361,178 @@ class NERExtractor:
             "Exchange", "Medi-Cal", "Part A", "Part B", "Part C", "Part D",
             "Advantage", "Supplement"
         ]
-    
-    def _setup_domain_patterns(self):
-        """Setup domain-specific patterns for the matcher"""
-        if not self.matcher:
-            return
-        
-        specialty_patterns = []
-        for specialty in self.medical_specialties:
-            words = specialty.split()
-            if len(words) == 1:
-                specialty_patterns.append([{"LOWER": words[0].lower()}])
-            else:
-                pattern = [{"LOWER": word.lower()} for word in words]
-                specialty_patterns.append(pattern)
-        
-        if specialty_patterns:
-            self.matcher.add("MEDICAL_SPECIALTY", specialty_patterns)
         
-        org_patterns = []
-        for alias in self.organization_aliases:
-            words = alias.split()
-            if len(words) == 1:
-                org_patterns.append([{"LOWER": words[0].lower()}])
-            else:
-                pattern = [{"LOWER": word.lower()} for word in words]
-                org_patterns.append(pattern)
-        
-        if org_patterns:
-            self.matcher.add("HEALTHCARE_ORG", org_patterns)
+        # Gazetteer phrases must be loaded before the matchers can be populated
+        if self.matcher is not None:
+            try:
+                self._setup_domain_patterns()
+            except Exception as e:
+                self.logger.error(f"Failed to set up spaCy domain patterns: {e}")
+                self.matcher = None
+                self.phrase_matcher = None
+        
+        # Gazetteer patterns compiled once here; the extract_* methods run them per text
+        self._synonym_res = [
+            (synonym, canonical_name, self._compile_synonym_patterns(synonym))
+            for synonym, canonical_name in self.specialty_synonyms.items()
+        ]
+        # One pass over the lowercased text finds which synonyms can match at all
+        self._synonym_scanner = PhraseScanner(
+            (synonym, idx) for idx, (synonym, _, _) in enumerate(self._synonym_res)
+        )
+        self._taxonomy_code_res = [
+            (re.compile(rf'\b{re.escape(taxonomy_code)}\b', re.IGNORECASE), canonical_name)
+            for taxonomy_code, canonical_name in self.taxonomy_codes.items()
+        ]
+        self._canonical_specialty_res = [
+            (specialty, re.compile(rf'\b{re.escape(specialty)}\b', re.IGNORECASE))
+            for specialty in self.medical_specialties
+        ]
+        self._canonical_specialty_scanner = PhraseScanner(
+            (specialty.lower(), idx) for idx, specialty in enumerate(self.medical_specialties)
+        )
+        # All LOB variants in one alternation, one capture group per variant (group i+1 is lob_variants[i])
+        self._lob_re = re.compile(
+            r'\b(?:' + '|'.join(f'({re.escape(lob)})' for lob in self.lob_variants) + r')\b',
+            re.IGNORECASE
+        )
+        self._lob_canonical = [self._map_lob_to_canonical(lob) for lob in self.lob_variants]
+    
+    def _get_pipeline(self, model: Optional[str], model_preference: str, prefer_gpu: bool):
+        """Process-wide cached pipeline, loaded on first use"""
+        cache_key = (model, model_preference, prefer_gpu)
+        with _PIPELINE_CACHE_LOCK:
+            nlp = _PIPELINE_CACHE.get(cache_key)
+            if nlp is None:
+                if prefer_gpu:
+                    self._prefer_gpu()
+                nlp = self._load_pipeline(model, model_preference)
+                _PIPELINE_CACHE[cache_key] = nlp
+            return nlp
+    
+    def _prefer_gpu(self):
+        """Route spaCy/Thinc ops to the GPU (CUDA, or MPS on Apple Silicon) if there is one"""
+        try:
+            if spacy.prefer_gpu():
+                self.logger.info("Using GPU for spaCy")
+        except (ImportError, RuntimeError, ValueError) as e:
+            self.logger.warning(f"GPU unavailable for spaCy, using CPU: {e}")
+    
+    def _load_pipeline(self, model: Optional[str] = None, model_preference: str = "auto"):
+        """Load the first available spaCy pipeline: the requested model, then the preferred stock ones"""
+        candidates = [model] if model else []
+        candidates += SPACY_MODEL_PREFERENCES[model_preference]
         
-        lob_patterns = []
-        for lob in self.lob_variants:
-            lob_patterns.append([{"LOWER": lob.lower()}])
+        for name in candidates:
+            try:
+                nlp = spacy.load(name, exclude=SPACY_EXCLUDED_PIPES)
+                self.logger.info(f"Loaded spaCy model {name}")
+                return nlp
+            except OSError:
+                continue
         
-        if lob_patterns:
-            self.matcher.add("LINE_OF_BUSINESS", lob_patterns)
+        self.logger.warning("No spaCy model available, using basic English")
+        return English()
+    
+    def _compile_synonym_patterns(self, synonym: str) -> list:
+        """Compiled patterns tried in order for one specialty synonym"""
+        if len(synonym) <= 2:
+            patterns = [rf'\b{re.escape(synonym)}\b']
+        else:
+            patterns = [
+                rf'\b{re.escape(synonym)}\b',  # Word boundary match
+                rf'{re.escape(synonym)}(?=\s|$|,|\.)',  # End of phrase match
+                rf'(?:^|[:\s]){re.escape(synonym)}(?=\s|$|,|\.)'  # After colon/space match
+            ]
+        return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    
+    def preprocess(self, texts: List[str], organization_texts: List[str] = ()) -> list:
+        """
+        Parse texts with a single nlp.pipe batch and cache the resulting Docs.
+        The cleaned body that extract_organizations parses for each of organization_texts
+        joins the same batch.
+        """
+        if not HAS_SPACY or not self.nlp:
+            return []
+        
+        batch = list(texts)
+        for text in organization_texts:
+            body_content = self._extract_body_content(text)
+            if body_content:
+                batch.append(self._clean_text_for_ner(body_content))
+        
+        docs = {}
+        for text in batch:
+            doc = self._cached_doc(text)
+            if doc is not None:
+                docs[text] = doc
+        missing = [text for text in dict.fromkeys(batch) if text not in docs]
+        if missing:
+            for text, doc in zip(missing, self.nlp.pipe(missing, batch_size=len(missing))):
+                docs[text] = doc
+                self._cache_doc(text, doc)
+        
+        return [docs[text] for text in texts]
+    
+    def _cached_doc(self, text: str):
+        """Cached Doc for text or None, marking it most recently used"""
+        with self._doc_cache_lock:
+            doc = self._doc_cache.pop(text, None)
+            if doc is not None:
+                self._doc_cache[text] = doc
+        return doc
+    
+    def _get_doc(self, text: str):
+        """Return the cached Doc for text, parsing it on a miss"""
+        doc = self._cached_doc(text)
+        if doc is None:
+            doc = self.nlp(text)
+            self._cache_doc(text, doc)
+        return doc
+    
+    def _doc_ents(self, doc, label: str) -> list:
+        """Entities of one label; doc.ents is grouped once per Doc and kept in doc.user_data"""
+        ents_by_label = doc.user_data.get('ents_by_label')
+        if ents_by_label is None:
+            ents_by_label = {}
+            for ent in doc.ents:
+                ents_by_label.setdefault(ent.label_, []).append(ent)
+            doc.user_data['ents_by_label'] = ents_by_label
+        return ents_by_label.get(label, [])
+    
+    def _doc_matches(self, doc, label: str) -> list:
+        """(start, end) token spans of one matcher label; matches are grouped once per Doc in doc.user_data"""
+        matches_by_label = doc.user_data.get('matches_by_label')
+        if matches_by_label is None:
+            matches_by_label = {}
+            strings = self.nlp.vocab.strings
+            for match_id, start, end in self.phrase_matcher(doc) + self.matcher(doc):
+                matches_by_label.setdefault(strings[match_id], []).append((start, end))
+            doc.user_data['matches_by_label'] = matches_by_label
+        return matches_by_label.get(label, [])
+    
+    def _cache_doc(self, text: str, doc) -> None:
+        with self._doc_cache_lock:
+            if len(self._doc_cache) >= self._doc_cache_size:
+                self._doc_cache.pop(next(iter(self._doc_cache)), None)
+            self._doc_cache[text] = doc
+    
+    def _setup_domain_patterns(self):
+        """Setup domain-specific patterns for the matchers"""
+        if self.matcher is None or self.phrase_matcher is None:
+            return
         
+        # Exact-phrase gazetteers go to the PhraseMatcher (case-insensitive via LOWER),
+        # which does one lookup pass per Doc however many phrases there are
+        for label, phrases in (
+            ("MEDICAL_SPECIALTY", self.medical_specialties),
+            ("HEALTHCARE_ORG", self.organization_aliases),
+            ("LINE_OF_BUSINESS", self.lob_variants),
+        ):
+            if phrases:
+                self.phrase_matcher.add(label, list(self.nlp.tokenizer.pipe(phrases)))
+        
+        # Titles need token attributes and operators, so they stay on the token Matcher
         title_patterns = [
             [{"LOWER": "dr"}, {"IS_PUNCT": True, "OP": "?"}],
             [{"LOWER": "doctor"}],
@@ -121,29 +550,24 @@ class NERExtractor:
             return self._extract_names_fallback(text)
         
         try:
-            doc = self.nlp(text)
+            doc = self._get_doc(text)
             
-            for ent in doc.ents:
-                if ent.label_ == "PERSON":
-                    if self._is_likely_provider_name(ent.text):
-                        candidate = ExtractionCandidate(
-                            value=self._normalize_name(ent.text),
-                            confidence=0.7,
-                            extractor_id="spacy_person",
-                            position=ent.start_char,
-                            context=self._get_surrounding_context(doc, ent),
-                            validation_passed=True
-                        )
-                        candidates.append(candidate)
+            for ent in self._doc_ents(doc, "PERSON"):
+                if self._is_likely_provider_name(ent.text):
+                    candidate = ExtractionCandidate(
+                        value=self._normalize_name(ent.text),
+                        confidence=0.7,
+                        extractor_id="spacy_person",
+                        position=ent.start_char,
+                        context=self._get_surrounding_context(doc, ent),
+                        validation_passed=True
+                    )
+                    candidates.append(candidate)
             
-            if self.matcher:
-                matches = self.matcher(doc)
-                for match_id, start, end in matches:
-                    label = self.nlp.vocab.strings[match_id]
-                    
-                    if label == "PROVIDER_TITLE":
-                        name_candidates = self._find_names_near_title(doc, start, end)
-                        candidates.extend(name_candidates)
+            if self.matcher is not None:
+                for start, end in self._doc_matches(doc, "PROVIDER_TITLE"):
+                    name_candidates = self._find_names_near_title(doc, start, end)
+                    candidates.extend(name_candidates)
         
         except Exception as e:
             self.logger.error(f"NER extraction failed: {e}")
@@ -169,47 +593,55 @@ class NERExtractor:
         
         return candidates
     
-    def _extract_body_content(self, text: str) -> str:
+    # The text helpers below are pure and see the same email text from several extractors
+    # (and from preprocess), so their results are memoized per text
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _extract_body_content(text: str) -> str:
         """Extract main body content excluding salutation and closing notes"""
-        lines = text.split('\n')
-        
+        # Works on line offsets into text rather than a split list; only the lines before
+        # the body and back to the closing are inspected, and the body is one slice
         body_start = 0
-        salutation_patterns = [
-            r'^dear\s+', r'^hi\s*,?$', r'^hello\s*,?$', r'^greetings\s*,?$',
-            r'^to\s+whom', r'^attention', r'^regarding'
-        ]
-        
-        for i, line in enumerate(lines):
-            line_lower = line.strip().lower()
-            if line_lower and not any(re.match(pattern, line_lower) for pattern in salutation_patterns):
-                if not re.match(r'^(from|to|subject|date|received):', line_lower) and \
-                   not re.match(r'^[a-z\s,&]+:$', line_lower):
-                    body_start = i
+        line_start = 0
+        while True:
+            line_end = text.find('\n', line_start)
+            if line_end < 0:
+                line_end = len(text)
+            line_lower = text[line_start:line_end].strip().lower()
+            if line_lower and not _SALUTATION_RE.match(line_lower):
+                if not _HEADER_LINE_RE.match(line_lower) and \
+                   not _LABEL_LINE_RE.match(line_lower):
+                    body_start = line_start
                     break
-        
-        body_end = len(lines)
-        closing_patterns = [
-            r'^best\s+(regards?|wishes)', r'^sincerely', r'^thank\s+you',
-            r'^regards?$', r'^thanks?$', r'^cheers?$', r'^yours?\s+',
-            r'^respectfully', r'^cordially'
-        ]
-        
-        for i in range(len(lines) - 1, body_start, -1):
-            line_lower = lines[i].strip().lower()
-            if line_lower and any(re.match(pattern, line_lower) for pattern in closing_patterns):
-                body_end = i
+            if line_end == len(text):
                 break
-        
-        body_lines = lines[body_start:body_end]
-        
-        while body_lines and not body_lines[0].strip():
-            body_lines.pop(0)
-        while body_lines and not body_lines[-1].strip():
-            body_lines.pop()
-        
-        return '\n'.join(body_lines)
+            line_start = line_end + 1
+        
+        # The closing is searched for in the lines after the first body line
+        body_end = len(text)
+        first_line_end = text.find('\n', body_start)
+        if first_line_end >= 0 and _CLOSING_HINT_RE.search(text, first_line_end):
+            line_end = len(text)
+            while line_end > first_line_end:
+                line_start = text.rfind('\n', first_line_end, line_end) + 1
+                line_lower = text[line_start:line_end].strip().lower()
+                if line_lower and _CLOSING_RE.match(line_lower):
+                    body_end = line_start - 1
+                    break
+                line_end = line_start - 1
+        
+        # Drop blank lines around the body
+        body = text[body_start:body_end]
+        if not body.strip():
+            return ''
+        first_content = len(body) - len(body.lstrip())
+        last_content = len(body.rstrip())
+        line_end = body.find('\n', last_content)
+        return body[body.rfind('\n', 0, first_content) + 1:line_end if line_end >= 0 else len(body)]
     
-    def _extract_table_content(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _extract_table_content(text: str) -> str:
         """Extract content that appears to be in table format"""
         lines = text.split('\n')
         table_lines = []
@@ -217,7 +649,7 @@ class NERExtractor:
         for line in lines:
             if '|' in line and line.count('|') >= 2:
                 table_lines.append(line)
-            elif re.search(r'\s+\|\s+', line) or re.search(r'\w+:\s*\w+\s*\|\s*\w+:', line):
+            elif _TABLE_PIPE_RE.search(line) or _TABLE_FIELD_PIPE_RE.search(line):
                 table_lines.append(line)
         
         return '\n'.join(table_lines)
@@ -231,38 +663,37 @@ class NERExtractor:
         
         try:
             cleaned_text = self._clean_text_for_ner(text)
-            doc = self.nlp(cleaned_text)
+            doc = self._get_doc(cleaned_text)
             
             all_candidates = []
             
-            for ent in doc.ents:
-                if ent.label_ == "ORG":
-                    org_name = ent.text.strip()
-                    
-                    if not self._is_healthcare_related(org_name):
-                        continue
-                    
-                    if self._is_health_plan_organization(org_name):
-                        continue
-                    
-                    expanded_org = self._expand_organization_name(doc, ent, cleaned_text)
-                    if expanded_org:
-                        if self._is_healthcare_related(expanded_org):
-                            org_name = expanded_org
-                    
-                    context = self._get_surrounding_context(doc, ent)
-                    
-                    confidence = self._calculate_org_confidence(org_name, context)
-                    
-                    candidate = ExtractionCandidate(
-                        value=self._normalize_org_name(org_name),
-                        confidence=confidence,
-                        extractor_id="body_ner_org",
-                        position=ent.start_char,
-                        context=context,
-                        validation_passed=True
-                    )
-                    all_candidates.append(candidate)
+            for ent in self._doc_ents(doc, "ORG"):
+                org_name = ent.text.strip()
+                
+                if not self._is_healthcare_related(org_name):
+                    continue
+                
+                if self._is_health_plan_organization(org_name):
+                    continue
+                
+                expanded_org = self._expand_organization_name(doc, ent, cleaned_text)
+                if expanded_org:
+                    if self._is_healthcare_related(expanded_org):
+                        org_name = expanded_org
+                
+                context = self._get_surrounding_context(doc, ent)
+                
+                confidence = self._calculate_org_confidence(org_name, context)
+                
+                candidate = ExtractionCandidate(
+                    value=self._normalize_org_name(org_name),
+                    confidence=confidence,
+                    extractor_id="body_ner_org",
+                    position=ent.start_char,
+                    context=context,
+                    validation_passed=True
+                )
+                all_candidates.append(candidate)
             
             candidates = self._filter_best_organizations(all_candidates)
         
@@ -278,39 +709,29 @@ class NERExtractor:
         
         candidates.sort(key=lambda x: len(x.value), reverse=True)
         
+        # Longest first, so a name is only ever contained in names already kept; drop those
         filtered = []
-        processed_names = set()
+        kept_names = []
         
         for candidate in candidates:
             candidate_lower = candidate.value.lower()
             
-            is_subset = False
-            for processed_name in processed_names:
-                if candidate_lower in processed_name or processed_name in candidate_lower:
-                    if len(candidate_lower) > len(processed_name):
-                        filtered = [c for c in filtered if c.value.lower() != processed_name]
-                        processed_names.discard(processed_name)
-                        break
-                    else:
-                        is_subset = True
-                        break
-            
-            if not is_subset:
+            if not any(candidate_lower in kept_name for kept_name in kept_names):
                 filtered.append(candidate)
-                processed_names.add(candidate_lower)
+                kept_names.append(candidate_lower)
         
         if filtered:
-            best_candidate = max(filtered, key=lambda x: x.confidence)
+            best_candidate = max(filtered, key=_CONFIDENCE_GETTER)
             return [best_candidate]
         
         return filtered
     
-    def _clean_text_for_ner(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _clean_text_for_ner(text: str) -> str:
         """Clean text to improve NER recognition"""
-        cleaned = re.sub(r'\n+', ' ', text)
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        cleaned = cleaned.strip()
-        return cleaned
+        # \s covers newlines, so one substitution collapses both
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
     def _expand_organization_name(self, doc, ent, original_text: str) -> Optional[str]:
         """Try to expand organization name to include adjacent parts like '& RCSSD'"""
@@ -319,7 +740,7 @@ class NERExtractor:
         
         remaining_text = original_text[end_char:end_char + 20]
         
-        expansion_match = re.match(r'\s*&\s+([A-Z][A-Z\s&]+)', remaining_text)
+        expansion_match = _ORG_EXPANSION_RE.match(remaining_text)
         if expansion_match:
             expansion = expansion_match.group(1).strip()
             if len(expansion) <= 10 and not any(word in expansion.lower() for word in ['the', 'and', 'or']):
@@ -335,26 +756,16 @@ class NERExtractor:
         
         org_lower = org_name.lower()
         
-        healthcare_terms = [
-            'medical', 'clinic', 'hospital', 'practice', 'physicians',
-            'health', 'healthcare', 'group', 'associates', 'center'
-        ]
-        
-        non_healthcare_terms = [
-            'microsoft', 'google', 'email', 'outlook', 'exchange',
-            'best regards', 'thank you', 'sincerely'
-        ]
-        
-        if any(term in org_lower for term in non_healthcare_terms):
+        if _NON_HEALTHCARE_TERM_RE.search(org_lower):
             return False
         
-        if any(term in org_lower for term in healthcare_terms):
+        if _HEALTHCARE_TERM_RE.search(org_lower):
             return True
         
         if len(org_name) >= 8:
             return True
         
-        if re.match(r'^[A-Z]+(\s*&\s*[A-Z]+)*$', org_name):
+        if _ACRONYM_ORG_RE.match(org_name):
             return True
         
         return False
@@ -365,13 +776,13 @@ class NERExtractor:
         org_lower = org_name.lower()
         context_lower = context.lower()
         
-        if any(term in org_lower for term in ['medical', 'clinic', 'hospital', 'practice']):
+        if _ORG_CONFIDENCE_FACILITY_RE.search(org_lower):
             base_confidence += 0.1
         
-        if any(term in context_lower for term in ['terminated with', 'affiliated with', 'practices at']):
+        if _ORG_CONFIDENCE_CONTEXT_RE.search(context_lower):
             base_confidence += 0.15
         
-        if any(term in org_lower for term in ['group', 'associates', 'partners']):
+        if _ORG_CONFIDENCE_GROUP_RE.search(org_lower):
             base_confidence += 0.05
         
         return min(base_confidence, 0.95)
@@ -379,36 +790,17 @@ class NERExtractor:
     
     def _is_bad_org_match(self, org_name: str) -> bool:
         """Filter out obviously bad organization name matches"""
-        org_lower = org_name.lower()
-        
-        bad_patterns = [
-            'provider', 'affiliation', 'network', 'best regards', 'hi', 'please',
-            'terminate', 'effective', 'date', 'tax id', 'license', 'npi'
-        ]
-        
-        return any(bad_pattern in org_lower for bad_pattern in bad_patterns)
+        return bool(_BAD_ORG_TERM_RE.search(org_name.lower()))
     
     def _clean_provider_org_name(self, org_name: str) -> str:
         """Clean and normalize provider organization name"""
         if not org_name:
             return ""
         
-        org_name = re.sub(r'^(the\s+)', '', org_name, flags=re.IGNORECASE)
-        org_name = re.sub(r'\s+(effective|on|as\s+of).*$', '', org_name, flags=re.IGNORECASE)
-        
-        org_name = re.sub(r'[.,;:\s]+$', '', org_name)
-        org_name = org_name.strip()
+        org_name = _ORG_CLEAN_RE.sub('', org_name).strip()
         
-        skip_patterns = [
-            r'^(effective|on|as\s+of|date|time)$',
-            r'^\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}$',  # Dates
-            r'^(january|february|march|april|may|june|july|august|september|october|november|december)$',
-            r'^\w{1,2}$',  # Single/double letters
-        ]
-        
-        for pattern in skip_patterns:
-            if re.match(pattern, org_name, re.IGNORECASE):
-                return ""
+        if _ORG_SKIP_RE.match(org_name):
+            return ""
         
         return org_name
     
@@ -417,33 +809,14 @@ class NERExtractor:
         context_lower = context.lower()
         org_lower = org_name.lower()
         
-        health_plan_indicators = [
-            'insurance', 'health plan', 'hmo', 'ppo', 'epo', 'pos',
-            'medicare', 'medicaid', 'coverage', 'benefits', 'plan',
-            'payor', 'payer', 'insurer'
-        ]
-        
-        provider_indicators = [
-            'medical group', 'medical center', 'clinic', 'hospital', 'practice',
-            'physicians', 'associates', 'health system', 'healthcare',
-            'terminated with', 'employed by', 'affiliated with', 'works at',
-            'practices at', 'joined', 'leaving'
-        ]
-        
-        for indicator in provider_indicators:
-            if indicator in context_lower:
-                return "provider"
+        if _PROVIDER_CONTEXT_RE.search(context_lower):
+            return "provider"
         
-        provider_org_patterns = [
-            'medical', 'clinic', 'hospital', 'practice', 'physicians', 
-            'health center', 'medical center', 'group', 'associates'
-        ]
-        if any(word in org_lower for word in provider_org_patterns):
+        if _PROVIDER_ORG_TERM_RE.search(org_lower):
             return "provider"
         
-        for indicator in health_plan_indicators:
-            if indicator in context_lower or indicator in org_lower:
-                return "health_plan"
+        if _HEALTH_PLAN_CONTEXT_RE.search(context_lower) or _HEALTH_PLAN_CONTEXT_RE.search(org_lower):
+            return "health_plan"
         
         return "unknown"
     
@@ -451,21 +824,10 @@ class NERExtractor:
         """Check if organization name indicates a health plan rather than provider using generic patterns"""
         org_lower = org_name.lower()
         
-        health_plan_patterns = [
-            'insurance', 'health plan', 'hmo', 'ppo', 'epo', 'pos',
-            'medicare', 'medicaid', 'coverage', 'benefits plan',
-            'health net', 'health care plan', 'managed care'
-        ]
-        
-        provider_override_patterns = [
-            'medical group', 'medical center', 'clinic', 'hospital',
-            'practice', 'physicians', 'health center', 'associates'
-        ]
-        
-        if any(pattern in org_lower for pattern in provider_override_patterns):
+        if _PROVIDER_OVERRIDE_RE.search(org_lower):
             return False
         
-        return any(pattern in org_lower for pattern in health_plan_patterns)
+        return bool(_HEALTH_PLAN_NAME_RE.search(org_lower))
     
     
     
@@ -492,24 +854,18 @@ class NERExtractor:
         """Extract specialties using comprehensive synonym matching"""
         candidates = []
         
-        for synonym, canonical_name in self.specialty_synonyms.items():
+        present = sorted(
+            idx for hits in self._synonym_scanner.find_all(text.lower()).values() for idx in hits
+        )
+        
+        for idx in present:
+            synonym, canonical_name, patterns = self._synonym_res[idx]
             if canonical_name in found_specialties:
                 continue
             
-            if len(synonym) <= 2:
-                patterns = [rf'\b{re.escape(synonym)}\b']
-            else:
-                patterns = [
-                    rf'\b{re.escape(synonym)}\b',  # Word boundary match
-                    rf'{re.escape(synonym)}(?=\s|$|,|\.)',  # End of phrase match
-                    rf'(?:^|[:\s]){re.escape(synonym)}(?=\s|$|,|\.)'  # After colon/space match
-                ]
-            
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
-                if matches:
-                    match = matches[0]
-                    
+                match = pattern.search(text)
+                if match:
                     if len(synonym) <= 2:
                         context_before = text[max(0, match.start()-20):match.start()].lower()
                         context_after = text[match.end():match.end()+20].lower()
@@ -535,12 +891,11 @@ class NERExtractor:
         """Extract specialties by recognizing taxonomy codes"""
         candidates = []
         
-        for taxonomy_code, canonical_name in self.taxonomy_codes.items():
+        for pattern, canonical_name in self._taxonomy_code_res:
             if canonical_name in found_specialties:
                 continue
-                
-            pattern = rf'\b{re.escape(taxonomy_code)}\b'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            
+            matches = pattern.finditer(text)
             
             for match in matches:
                 candidate = ExtractionCandidate(
@@ -564,52 +919,56 @@ class NERExtractor:
         try:
             from rapidfuzz import fuzz, process
             
-            medical_keywords = ['medicine', 'surgery', 'ology', 'ics', 'ist', 'ian', 'specialty', 'field']
             potential_phrases = []
             
-            for keyword in medical_keywords:
-                pattern = rf'(\w+(?:\s+\w+)*\s+{keyword}|\w*{keyword}\w*(?:\s+\w+)*)'
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
+            present = {match.lastindex - 1 for match in _FUZZY_KEYWORD_HINT_RE.finditer(text)}
+            for idx, pattern in enumerate(_FUZZY_KEYWORD_RES):
+                if idx not in present:
+                    continue
+                for match in pattern.finditer(text):
                     phrase = match.group(0).strip()
                     if len(phrase) > 3:
                         potential_phrases.append((phrase, match.start()))
             
-            specialty_context_patterns = [
-                r'specialty[:\s]+([^,.\n]+)',
-                r'field[:\s]+([^,.\n]+)',
-                r'specialization[:\s]+([^,.\n]+)',
-                r'area[:\s]+([^,.\n]+)',
-                r'practice[:\s]+([^,.\n]+)'
-            ]
-            
-            for pattern in specialty_context_patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
-                for match in matches:
+            seen_phrases = {phrase for phrase, _ in potential_phrases}
+            present = {match.lastindex - 1 for match in _FUZZY_CONTEXT_HINT_RE.finditer(text)}
+            for idx, pattern in enumerate(_FUZZY_CONTEXT_RES):
+                if idx not in present:
+                    continue
+                for match in pattern.finditer(text):
                     phrase = match.group(1).strip()
-                    if len(phrase) > 3 and phrase not in [p[0] for p in potential_phrases]:
+                    if len(phrase) > 3 and phrase not in seen_phrases:
                         potential_phrases.append((phrase, match.start()))
+                        seen_phrases.add(phrase)
+            
+            if not potential_phrases or not self.medical_specialties:
+                return candidates
+            
+            # Score all phrases against all specialties in one batched call per scorer
+            # (scores under the cutoff come back as 0, argmax keeps the first best choice);
+            # partial_ratio is only computed for phrases without a full-ratio match
+            phrases = [phrase for phrase, _ in potential_phrases]
+            scores = process.cdist(
+                phrases, self.medical_specialties, scorer=fuzz.ratio,
+                score_cutoff=80, dtype=np.float64
+            )
+            best_idx = scores.argmax(axis=1)
+            best_scores = scores.max(axis=1)
             
-            for phrase, position in potential_phrases:
-                best_match = process.extractOne(
-                    phrase, 
-                    self.medical_specialties, 
-                    scorer=fuzz.ratio,
-                    score_cutoff=80
+            unmatched = np.flatnonzero(best_scores == 0)
+            if unmatched.size:
+                partial_scores = process.cdist(
+                    [phrases[i] for i in unmatched], self.medical_specialties, scorer=fuzz.partial_ratio,
+                    score_cutoff=85, dtype=np.float64
                 )
-                
-                if not best_match:
-                    best_match = process.extractOne(
-                        phrase, 
-                        self.medical_specialties, 
-                        scorer=fuzz.partial_ratio,
-                        score_cutoff=85
-                    )
-                
-                if best_match and best_match[0] not in found_specialties:
-                    canonical_name = best_match[0]
-                    similarity_score = best_match[1]
-                    
+                best_idx[unmatched] = partial_scores.argmax(axis=1)
+                best_scores[unmatched] = partial_scores.max(axis=1)
+            
+            for (phrase, position), idx, similarity_score in zip(
+                potential_phrases, best_idx.tolist(), best_scores.tolist()
+            ):
+                canonical_name = self.medical_specialties[idx]
+                if similarity_score > 0 and canonical_name not in found_specialties:
                     if similarity_score >= 90:
                         confidence = 0.8
                     elif similarity_score >= 85:
@@ -639,35 +998,31 @@ class NERExtractor:
         """Extract specialties using spaCy NER with domain matcher"""
         candidates = []
         
-        if not HAS_SPACY or not self.nlp or not self.matcher:
+        if not HAS_SPACY or not self.nlp or self.matcher is None:
             return candidates
             
         try:
-            doc = self.nlp(text)
+            doc = self._get_doc(text)
             
-            matches = self.matcher(doc)
-            for match_id, start, end in matches:
-                label = self.nlp.vocab.strings[match_id]
+            for start, end in self._doc_matches(doc, "MEDICAL_SPECIALTY"):
+                span = doc[start:end]
+                specialty_text = span.text
                 
-                if label == "MEDICAL_SPECIALTY":
-                    span = doc[start:end]
-                    specialty_text = span.text
-                    
-                    canonical_name = self.specialty_synonyms.get(specialty_text.lower())
-                    if not canonical_name:
-                        canonical_name = specialty_text
-                    
-                    if canonical_name not in found_specialties:
-                        candidate = ExtractionCandidate(
-                            value=canonical_name,
-                            confidence=0.85,
-                            extractor_id="spacy_domain_ner",
-                            position=span.start_char,
-                            context=self._get_surrounding_context(doc, span),
-                            validation_passed=True
-                        )
-                        candidates.append(candidate)
-                        found_specialties.add(canonical_name)
+                canonical_name = self.specialty_synonyms.get(specialty_text.lower())
+                if not canonical_name:
+                    canonical_name = specialty_text
+                
+                if canonical_name not in found_specialties:
+                    candidate = ExtractionCandidate(
+                        value=canonical_name,
+                        confidence=0.85,
+                        extractor_id="spacy_domain_ner",
+                        position=span.start_char,
+                        context=self._get_surrounding_context(doc, span),
+                        validation_passed=True
+                    )
+                    candidates.append(candidate)
+                    found_specialties.add(canonical_name)
         
         except Exception as e:
             self.logger.error(f"spaCy specialty NER failed: {e}")
@@ -678,12 +1033,16 @@ class NERExtractor:
         """Fallback: exact matching on canonical specialty names"""
         candidates = []
         
-        for specialty in self.medical_specialties:
+        present = sorted(
+            idx for hits in self._canonical_specialty_scanner.find_all(text.lower()).values() for idx in hits
+        )
+        
+        for idx in present:
+            specialty, pattern = self._canonical_specialty_res[idx]
             if specialty in found_specialties:
                 continue
-                
-            pattern = rf'\b{re.escape(specialty)}\b'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+            
+            matches = pattern.finditer(text)
             
             for match in matches:
                 candidate = ExtractionCandidate(
@@ -705,25 +1064,28 @@ class NERExtractor:
         candidates = []
         found_lobs = set()
         
-        for lob in self.lob_variants:
-            pattern = r'\b' + re.escape(lob) + r'\b'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        # One scan records the first match of each variant; candidates are then built in
+        # variant order so each canonical LOB keeps the position of its first listed variant
+        first_matches = {}
+        for match in self._lob_re.finditer(text):
+            first_matches.setdefault(match.lastindex - 1, match)
+        
+        for idx in sorted(first_matches):
+            match = first_matches[idx]
+            canonical_lob = self._lob_canonical[idx]
             
-            for match in matches:
-                canonical_lob = self._map_lob_to_canonical(lob)
+            if canonical_lob not in found_lobs:
+                found_lobs.add(canonical_lob)
                 
-                if canonical_lob not in found_lobs:
-                    found_lobs.add(canonical_lob)
-                    
-                    candidate = ExtractionCandidate(
-                        value=canonical_lob,
-                        confidence=0.9,
-                        extractor_id="lob_gazetteer",
-                        position=match.start(),
-                        context=text[max(0, match.start()-20):match.end()+20],
-                        validation_passed=True
-                    )
-                    candidates.append(candidate)
+                candidate = ExtractionCandidate(
+                    value=canonical_lob,
+                    confidence=0.9,
+                    extractor_id="lob_gazetteer",
+                    position=match.start(),
+                    context=text[max(0, match.start()-20):match.end()+20],
+                    validation_passed=True
+                )
+                candidates.append(candidate)
         
         return candidates
     
@@ -731,27 +1093,8 @@ class NERExtractor:
         """Fallback date extraction using regex patterns for word formats"""
         candidates = []
         
-        months = [
-            'january', 'february', 'march', 'april', 'may', 'june',
-            'july', 'august', 'september', 'october', 'november', 'december',
-            'jan', 'feb', 'mar', 'apr', 'may', 'jun',
-            'jul', 'aug', 'sep', 'oct', 'nov', 'dec'
-        ]
-        
-        month_pattern = '|'.join(months)
-        date_patterns = [
-            # "22 September 2025"
-            rf'(\d{{1,2}})\s+({month_pattern})\s+(\d{{4}})',
-            # "September 22, 2025" 
-            rf'({month_pattern})\s+(\d{{1,2}}),?\s+(\d{{4}})',
-            # "22nd September 2025"
-            rf'(\d{{1,2}})(?:st|nd|rd|th)?\s+({month_pattern})\s+(\d{{4}})',
-            # "September 2025" (month and year only)
-            rf'({month_pattern})\s+(\d{{4}})'
-        ]
-        
-        for i, pattern in enumerate(date_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(_WORD_DATE_RES):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 date_text = match.group(0)
@@ -770,51 +1113,47 @@ class NERExtractor:
         
         return candidates
     
-    def _normalize_word_date(self, date_str: str) -> Optional[str]:
+    # The same entity texts recur across emails, and dateutil is the slow path
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_word_date(date_str: str) -> Optional[str]:
         """Normalize word format dates to MM/DD/YYYY"""
-        import re
-        
         date_str = date_str.strip()
         
-        month_map = {
-            'january': 1, 'jan': 1, 'february': 2, 'feb': 2,
-            'march': 3, 'mar': 3, 'april': 4, 'apr': 4,
-            'may': 5, 'june': 6, 'jun': 6,
-            'july': 7, 'jul': 7, 'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9, 'october': 10, 'oct': 10,
-            'november': 11, 'nov': 11, 'december': 12, 'dec': 12
-        }
-        
         try:
             # Handle "Effective 22nd September 2025" format (extract date part)
-            effective_match = re.search(r'effective\s+(\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4})', date_str, re.IGNORECASE)
+            effective_match = _EFFECTIVE_DATE_RE.search(date_str)
             if effective_match:
                 date_str = effective_match.group(1)
             
             # "22 September 2025" or "22nd September 2025"
-            match = re.match(r'(\d{1,2})(?:st|nd|rd|th)?\s+(\w+)\s+(\d{4})', date_str, re.IGNORECASE)
+            match = _DAY_MONTH_YEAR_RE.match(date_str)
             if match:
                 day, month_name, year = match.groups()
-                month = month_map.get(month_name.lower())
+                month = _MONTH_MAP.get(month_name.lower())
                 if month:
                     return f"{month:02d}/{int(day):02d}/{year}"
             
             # "September 22, 2025"
-            match = re.match(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})', date_str, re.IGNORECASE)
+            match = _MONTH_DAY_YEAR_RE.match(date_str)
             if match:
                 month_name, day, year = match.groups()
-                month = month_map.get(month_name.lower())
+                month = _MONTH_MAP.get(month_name.lower())
                 if month:
                     return f"{month:02d}/{int(day):02d}/{year}"
             
             # "September 2025" (assume 1st of month)
-            match = re.match(r'(\w+)\s+(\d{4})', date_str, re.IGNORECASE)
+            match = _MONTH_YEAR_RE.match(date_str)
             if match:
                 month_name, year = match.groups()
-                month = month_map.get(month_name.lower())
+                month = _MONTH_MAP.get(month_name.lower())
                 if month:
                     return f"{month:02d}/01/{year}"
             
+            # Without a digit, dateutil can only fill the date in from today
+            if not _DIGIT_RE.search(date_str):
+                return None
+            
             parsed_date = date_parser.parse(date_str, fuzzy=True)
             return f"{parsed_date.month:02d}/{parsed_date.day:02d}/{parsed_date.year}"
                 
@@ -823,24 +1162,39 @@ class NERExtractor:
         
         return None
     
-    def _load_specialties_config(self) -> Optional[Dict]:
+    @staticmethod
+    def _specialties_config_key() -> tuple:
+        """(path, mtime) of the specialties config, mtime None when the file is missing"""
+        config_path = Path(__file__).parent.parent.parent / "configs" / "specialties.yml"
+        try:
+            return config_path, config_path.stat().st_mtime_ns
+        except OSError:
+            return config_path, None
+    
+    # The specialty config and the tables derived from it are the same for every instance,
+    # so they are built once per version of the file and shared; callers must not mutate them
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_specialties_config(config_key: tuple) -> Optional[Dict]:
         """Load medical specialties from YAML configuration file"""
+        logger = logging.getLogger(__name__)
         try:
-            config_path = Path(__file__).parent.parent.parent / "configs" / "specialties.yml"
+            config_path, mtime = config_key
             
-            if config_path.exists():
+            if mtime is not None:
                 with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_YAML_LOADER)
                     return config.get('specialties', {})
             else:
-                self.logger.warning(f"Specialties config file not found: {config_path}")
-                return self._get_fallback_specialties()
+                logger.warning(f"Specialties config file not found: {config_path}")
+                return NERExtractor._get_fallback_specialties()
                 
         except Exception as e:
-            self.logger.error(f"Failed to load specialties config: {e}")
-            return self._get_fallback_specialties()
+            logger.error(f"Failed to load specialties config: {e}")
+            return NERExtractor._get_fallback_specialties()
     
-    def _get_fallback_specialties(self) -> Dict:
+    @staticmethod
+    def _get_fallback_specialties() -> Dict:
         """Fallback hardcoded specialties if YAML loading fails"""
         return {
             "Internal Medicine": {"synonyms": ["internal medicine", "internal med", "im", "internist"]},
@@ -867,30 +1221,27 @@ class NERExtractor:
             "Immunology": {"synonyms": ["immunology", "immunologist"]}
         }
     
-    def _build_specialty_synonyms(self) -> Dict[str, str]:
-        """Build reverse mapping from synonyms to canonical specialty names"""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _build_specialty_maps(config_key: tuple) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Build the reverse mapping from synonyms to canonical specialty names and the
+        mapping from taxonomy codes (synonyms shaped like one) in a single pass
+        """
         synonym_map = {}
+        taxonomy_map = {}
         
-        for canonical_name, config in self.specialties_config.items():
+        for canonical_name, config in NERExtractor._load_specialties_config(config_key).items():
             synonym_map[canonical_name.lower()] = canonical_name
             
             synonyms = config.get('synonyms', [])
             for synonym in synonyms:
-                synonym_map[synonym.lower()] = canonical_name
-        
-        return synonym_map
-    
-    def _build_taxonomy_mappings(self) -> Dict[str, str]:
-        """Build mapping from taxonomy codes to specialty names"""
-        taxonomy_map = {}
-        
-        for canonical_name, config in self.specialties_config.items():
-            synonyms = config.get('synonyms', [])
-            for synonym in synonyms:
-                if re.match(r'^[0-9]{3,4}[a-z]*[0-9]{4,}x$', synonym.lower()):
-                    taxonomy_map[synonym.lower()] = canonical_name
+                synonym_lower = synonym.lower()
+                synonym_map[synonym_lower] = canonical_name
+                if _TAXONOMY_CODE_RE.match(synonym_lower):
+                    taxonomy_map[synonym_lower] = canonical_name
         
-        return taxonomy_map
+        return synonym_map, taxonomy_map
     
     def extract_dates(self, text: str) -> List[ExtractionCandidate]:
         """Extract dates using NER (handles word formats like '22 September 2025')"""
@@ -900,31 +1251,30 @@ class NERExtractor:
             return self._extract_dates_fallback(text)
         
         try:
-            doc = self.nlp(text)
+            doc = self._get_doc(text)
             
-            for ent in doc.ents:
-                if ent.label_ == "DATE":
-                    normalized_date = self._normalize_word_date(ent.text)
+            for ent in self._doc_ents(doc, "DATE"):
+                normalized_date = self._normalize_word_date(ent.text)
+                
+                if normalized_date:
+                    context = self._get_surrounding_context(doc, ent)
+                    context_lower = context.lower()
                     
-                    if normalized_date:
-                        context = self._get_surrounding_context(doc, ent)
-                        context_lower = context.lower()
-                        
-                        confidence = 0.8
-                        if any(keyword in context_lower for keyword in ['effective', 'start', 'begin']):
-                            confidence = 0.9
-                        elif any(keyword in context_lower for keyword in ['term', 'end', 'finish', 'expir']):
-                            confidence = 0.9
-                        
-                        candidate = ExtractionCandidate(
-                            value=normalized_date,
-                            confidence=confidence,
-                            extractor_id="spacy_date",
-                            position=ent.start_char,
-                            context=context,
-                            validation_passed=True
-                        )
-                        candidates.append(candidate)
+                    confidence = 0.8
+                    if _DATE_START_CONTEXT_RE.search(context_lower):
+                        confidence = 0.9
+                    elif _DATE_END_CONTEXT_RE.search(context_lower):
+                        confidence = 0.9
+                    
+                    candidate = ExtractionCandidate(
+                        value=normalized_date,
+                        confidence=confidence,
+                        extractor_id="spacy_date",
+                        position=ent.start_char,
+                        context=context,
+                        validation_passed=True
+                    )
+                    candidates.append(candidate)
         
         except Exception as e:
             self.logger.error(f"Date NER extraction failed: {e}")
@@ -937,30 +1287,11 @@ class NERExtractor:
         candidates = []
         text_lower = text.lower()
         
-        explicit_phrases = {
-            'Term': [
-                'provider termination', 'terminate provider', 'provider term',
-                'discontinue provider', 'remove provider', 'end provider',
-                'provider withdrawal', 'cancel provider', 'provider departure'
-            ],
-            'Update': [
-                'address change', 'phone change', 'information change',
-                'provider update', 'update provider', 'modify provider',
-                'change provider', 'provider modification', 'address update',
-                'phone update', 'demographic change', 'contact change',
-                'location change', 'practice change', 'office change'
-            ],
-            'Add': [
-                'new provider', 'add provider', 'provider enrollment', 
-                'provider addition', 'include provider', 'onboard provider',
-                'welcome provider', 'provider registration', 'provider credentialing'
-            ]
-        }
-        
-        for transaction_type, phrases in explicit_phrases.items():
+        positions = _EXPLICIT_TRANSACTION_SCANNER.find_first(text_lower)
+        for transaction_type, phrases in _EXPLICIT_TRANSACTION_PHRASES.items():
             for phrase in phrases:
-                if phrase in text_lower:
-                    position = text_lower.find(phrase)
+                position = positions.get(phrase)
+                if position is not None:
                     candidate = ExtractionCandidate(
                         value=transaction_type,
                         confidence=0.95,
@@ -985,15 +1316,10 @@ class NERExtractor:
             candidates.append(candidate)
             return candidates
         
-        terminate_patterns = [
-            r'\bterminate\b', r'\bterminated\b', r'\btermination\b',
-            r'\bremove\b', r'\bdiscontinue\b', r'\bwithdraw\b',
-            r'\bcancel\b', r'\bexpire\b', r'\bcease\b', r'\bend\b',
-            r'\bstop\b', r'no longer'
-        ]
-        
-        for pattern in terminate_patterns:
-            match = re.search(pattern, text_lower)
+        for keyword, pattern in _TERM_KEYWORD_RES:
+            if keyword not in text_lower:
+                continue
+            match = pattern.search(text_lower)
             if match:
                 candidate = ExtractionCandidate(
                     value='Term',
@@ -1007,15 +1333,11 @@ class NERExtractor:
                 return candidates
         
         # Update keywords
-        update_patterns = [
-            r'\bupdate\b', r'\bmodify\b', r'\bchange\b', r'\brevise\b',
-            r'\bamend\b', r'\bcorrect\b', r'\bedit\b', r'\badjust\b',
-            r'\balter\b', r'\brefresh\b', r'\bmove\b', r'\brelocate\b'
-        ]
-        
         update_found = False
-        for pattern in update_patterns:
-            match = re.search(pattern, text_lower)
+        for keyword, pattern in _UPDATE_KEYWORD_RES:
+            if keyword not in text_lower:
+                continue
+            match = pattern.search(text_lower)
             if match:
                 context_window = text_lower[max(0, match.start()-50):match.end()+50]
                 change_indicators = ['address', 'phone', 'contact', 'location', 'information', 'demographic', 'details']
@@ -1039,14 +1361,10 @@ class NERExtractor:
         
         # Add keywords
         if not update_found:
-            add_patterns = [
-                r'\badd\b', r'\bnew\b', r'\binclude\b', r'\benroll\b',
-                r'\bregister\b', r'\bjoin\b', r'\bwelcome\b', r'\bonboard\b',
-                r'\brecruit\b', r'\bhire\b'
-            ]
-            
-            for pattern in add_patterns:
-                match = re.search(pattern, text_lower)
+            for keyword, pattern in _ADD_KEYWORD_RES:
+                if keyword not in text_lower:
+                    continue
+                match = pattern.search(text_lower)
                 if match:
                     context_window = text_lower[max(0, match.start()-50):match.end()+50]
                     update_indicators = ['change', 'modify', 'update', 'alter', 'correct']
@@ -1073,80 +1391,28 @@ class NERExtractor:
         scores = {'Add': 0, 'Update': 0, 'Term': 0}
         best_match = {'type': None, 'confidence': 0, 'position': 0, 'context': ''}
         
-        context_indicators = {
-            'Update': {
-                'strong': [
-                    ('effective date', 2.0), ('address change', 2.0), ('phone change', 2.0),
-                    ('contact change', 2.0), ('location change', 2.0), ('move', 1.8),
-                    ('relocate', 1.8), ('transfer', 1.5), ('modify', 1.5)
-                ],
-                'medium': [
-                    ('change', 1.2), ('update', 1.2), ('revise', 1.0), ('correct', 1.0),
-                    ('edit', 1.0), ('adjust', 1.0), ('alter', 1.0)
-                ],
-                'weak': [
-                    ('different', 0.5), ('new address', 0.8), ('new phone', 0.8),
-                    ('updated', 0.7), ('current', 0.3)
-                ]
-            },
-            'Add': {
-                'strong': [
-                    ('new provider', 2.5), ('welcome', 2.0), ('enrollment', 2.0),
-                    ('credentialing', 2.0), ('onboard', 1.8), ('recruit', 1.8),
-                    ('joined our network', 2.2), ('joining our network', 2.2),
-                    ('has joined', 2.0), ('will be joining', 2.0)
-                ],
-                'medium': [
-                    ('new', 1.0), ('add', 1.2), ('include', 1.0), ('join', 1.2),
-                    ('register', 1.2), ('enroll', 1.5), ('joined', 1.4), 
-                    ('joining', 1.4), ('please add', 1.8)
-                ],
-                'weak': [
-                    ('first time', 0.8), ('initial', 0.5), ('begin', 0.5)
-                ]
-            },
-            'Term': {
-                'strong': [
-                    ('termination', 2.5), ('terminated', 2.0), ('departure', 2.0),
-                    ('discontinue', 2.0), ('withdraw', 1.8), ('cease', 1.8),
-                    ('no longer be associated', 2.2), ('will no longer', 2.0),
-                    ('process the termination', 2.3)
-                ],
-                'medium': [
-                    ('remove', 1.2), ('end', 1.0), ('stop', 1.2), ('cancel', 1.5),
-                    ('expire', 1.3), ('no longer associated', 1.6)
-                ],
-                'weak': [
-                    ('no longer', 1.5), ('final', 0.5), ('last', 0.3)
-                ]
-            }
-        }
-        
-        for trans_type, categories in context_indicators.items():
-            for indicators in categories.values():
-                for indicator, weight in indicators:
-                    if indicator in text_lower:
-                        scores[trans_type] += weight
-                        
-                        if scores[trans_type] > best_match['confidence']:
-                            position = text_lower.find(indicator)
-                            best_match.update({
-                                'type': trans_type,
-                                'confidence': min(scores[trans_type] / 3.0, 0.9),
-                                'position': position,
-                                'context': text_lower[max(0, position-30):position+len(indicator)+30]
-                            })
-
-        subject_patterns = {
-            'Add': [r'new\s+provider', r'provider\s+enrollment', r'welcome', r'onboard'],
-            'Update': [r'address\s+change', r'update', r'change', r'modify', r'move'],
-            'Term': [r'termination', r'terminate', r'end', r'discontinue']
-        }
+        # First position of every indicator present, from the same pass that finds them
+        positions = _CONTEXT_INDICATOR_SCANNER.find_first(text_lower)
+        present = sorted(
+            idx for indicator in positions for idx in _CONTEXT_INDICATOR_SCANNER.payloads[indicator]
+        )
+        for idx in present:
+            trans_type, indicator, weight = _TRANSACTION_CONTEXT_WEIGHTS[idx]
+            scores[trans_type] += weight
+            
+            if scores[trans_type] > best_match['confidence']:
+                position = positions[indicator]
+                best_match.update({
+                    'type': trans_type,
+                    'confidence': min(scores[trans_type] / 3.0, 0.9),
+                    'position': position,
+                    'context': text_lower[max(0, position-30):position+len(indicator)+30]
+                })
 
         first_50_chars = text_lower[:50]
-        for trans_type, patterns in subject_patterns.items():
+        for trans_type, patterns in _SUBJECT_TRANSACTION_RES.items():
             for pattern in patterns:
-                if re.search(pattern, first_50_chars):
+                if pattern.search(first_50_chars):
                     scores[trans_type] += 1.5
                     if scores[trans_type] > best_match['confidence'] * 3.0:
                         best_match.update({
@@ -1168,12 +1434,11 @@ class NERExtractor:
         if max_score > 0:
             best_type = max(scores, key=scores.get)
             if best_type != best_match['type'] or scores[best_type] > best_match['confidence'] * 3.0:
-                key_indicators = [item[0] for sublist in context_indicators[best_type].values() for item in sublist]
                 position = 0
                 context = text_lower[:50]
-                for indicator in key_indicators:
-                    if indicator in text_lower:
-                        position = text_lower.find(indicator)
+                for indicator in _TRANSACTION_KEY_INDICATORS[best_type]:
+                    if indicator in positions:
+                        position = positions[indicator]
                         context = text_lower[max(0, position-30):position+len(indicator)+30]
                         break
                 
@@ -1190,14 +1455,8 @@ class NERExtractor:
         """Fallback name extraction without spaCy"""
         candidates = []
         
-        name_patterns = [
-            r'Dr\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]*\.?\s+)*[A-Z][a-z]+)',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+M\.?D\.?',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+),?\s+D\.?O\.?',
-        ]
-        
-        for i, pattern in enumerate(name_patterns):
-            matches = re.finditer(pattern, text)
+        for i, pattern in enumerate(_NAME_PATTERN_RES):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 name = match.group(1) if match.groups() else match.group(0)
@@ -1236,7 +1495,7 @@ class NERExtractor:
         """Normalize provider name"""
         name = ' '.join(name.split())
         
-        name = re.sub(r',\s*(M\.?D\.?|D\.?O\.?)$', r', \1', name, flags=re.IGNORECASE)
+        name = _NAME_DEGREE_SUFFIX_RE.sub(r', \1', name)
         
         return name.strip()
     
@@ -1272,7 +1531,9 @@ class NERExtractor:
         """Get context around a spaCy span"""
         start = max(0, span.start - 10)
         end = min(len(doc), span.end + 10)
-        return doc[start:end].text.replace('\n', ' ')
+        # One slice of doc.text rather than Span.text joining every token of the window
+        window = doc[start:end]
+        return doc.text[window.start_char:window.end_char].replace('\n', ' ')
     
     def _find_names_near_title(self, doc, title_start, title_end):
         """Find names near provider titles"""
@@ -1281,20 +1542,24 @@ class NERExtractor:
         window_start = max(0, title_start - 5)
         window_end = min(len(doc), title_end + 5)
         
-        for token in doc[window_start:window_end]:
-            if token.ent_type_ == "PERSON":
-                ent = token.ent
-                if self._is_likely_provider_name(ent.text):
-                    candidate = ExtractionCandidate(
-                        value=self._normalize_name(ent.text),
-                        confidence=0.9,
-                        extractor_id="title_adjacent_name",
-                        position=ent.start_char,
-                        context=self._get_surrounding_context(doc, ent),
-                        validation_passed=True
-                    )
-                    candidates.append(candidate)
-                    break
+        # First PERSON entity overlapping the window, taken from the per-Doc entity groups
+        # instead of walking the window token by token
+        for ent in self._doc_ents(doc, "PERSON"):
+            if ent.end <= window_start:
+                continue
+            if ent.start >= window_end:
+                break
+            if self._is_likely_provider_name(ent.text):
+                candidate = ExtractionCandidate(
+                    value=self._normalize_name(ent.text),
+                    confidence=0.9,
+                    extractor_id="title_adjacent_name",
+                    position=ent.start_char,
+                    context=self._get_surrounding_context(doc, ent),
+                    validation_passed=True
+                )
+                candidates.append(candidate)
+                break
         
         return candidates
     
@@ -3,11 +3,42 @@ Regex Extractors
 """
 
 import re
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import logging
 
 
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_NON_ALNUM_RE = re.compile(r'[^\dA-Za-z]')
+_LICENSE_FORMAT_RE = re.compile(r'^[A-Z]\d{5,6}$')
+_PPG_FALSE_POSITIVES = frozenset({'PPG', 'ID', 'TIN', 'NPI', 'MD', 'DR', 'HMO', 'PPO'})
+_CONFIDENCE_GETTER = attrgetter('confidence')
+_DATE_FORMAT_RES = (
+    re.compile(r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})'),  # MM/DD/YY or MM/DD/YYYY
+    re.compile(r'(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})'),    # YYYY/MM/DD
+)
+
+# Text every pattern of a field needs; a miss skips all of that field's scans.
+# Matched case-sensitively against the lowercased text from _lowered.
+_NPI_ANCHOR_RE = re.compile(r'npi|provider|national')
+_TIN_ANCHOR_RE = re.compile(r'\d{2}-?\d{7}')
+_PPG_ANCHOR_RE = re.compile(r'ppg|group|shared\s+risk')
+_PHONE_ANCHOR_RE = re.compile(r'phone|tel|contact|\(\d{3}\)')
+_FAX_ANCHOR_RE = re.compile(r'fax|facsimile')
+_LICENSE_ANCHOR_RE = re.compile(r'lic')
+_DATE_ANCHOR_RE = re.compile(r'\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}')
+
+# The engine hands the same block and email strings to every extractor in turn,
+# so each text is lowercased once rather than once per extractor
+_lowered = lru_cache(maxsize=8)(str.lower)
+
+
+def _compile_all(patterns: List[str], flags: int = re.IGNORECASE) -> List[re.Pattern]:
+    return [re.compile(pattern, flags) for pattern in patterns]
+
+
 @dataclass
 class ExtractionCandidate:
     """Container for an extraction candidate with metadata"""
@@ -178,19 +209,34 @@ class PatternExtractor:
         self.negation_patterns = [
             r'not\s+terminate', r'no\s+changes', r'don\'t\s+', r'will\s+not'
         ]
+        
+        # Compiled once here; the extract_* methods run them on every block
+        self._npi_res = _compile_all(self.npi_patterns)
+        self._tin_res = _compile_all(self.tin_patterns)
+        self._ppg_res = _compile_all(self.ppg_patterns)
+        self._phone_res = _compile_all(self.phone_patterns)
+        self._fax_res = _compile_all(self.fax_patterns)
+        self._license_res = _compile_all(self.license_patterns)
+        self._date_res = _compile_all(self.date_patterns)
+        self._transaction_res = {
+            trans_type: _compile_all(patterns) for trans_type, patterns in self.transaction_patterns.items()
+        }
+        self._negation_res = _compile_all(self.negation_patterns, 0)
     
-    def extract_npi_candidates(self, text: str) -> List[ExtractionCandidate]:
-        """Extract NPI candidates with Luhn validation"""
+    def extract_npi_candidates(self, text: str, max_candidates: Optional[int] = None) -> List[ExtractionCandidate]:
+        """Extract NPI candidates with Luhn validation, stopping after max_candidates if given"""
         candidates = []
+        if not _NPI_ANCHOR_RE.search(_lowered(text)):
+            return candidates
         
-        for i, pattern in enumerate(self.npi_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(self._npi_res):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 npi = match.group(1) if match.groups() else match.group(0)
                 
                 # Clean NPI
-                npi_clean = re.sub(r'[^\d]', '', npi)
+                npi_clean = _NON_DIGIT_RE.sub('', npi)
                 
                 if len(npi_clean) == 10:
                     # Luhn validation
@@ -205,21 +251,25 @@ class PatternExtractor:
                         validation_passed=validation_passed
                     )
                     candidates.append(candidate)
+                    if max_candidates is not None and len(candidates) >= max_candidates:
+                        return candidates
         
         return candidates
     
     def extract_tin_candidates(self, text: str) -> List[ExtractionCandidate]:
         """Extract TIN candidates with length validation"""
         candidates = []
+        if not _TIN_ANCHOR_RE.search(_lowered(text)):
+            return candidates
         
-        for i, pattern in enumerate(self.tin_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(self._tin_res):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 tin = match.group(1) if match.groups() else match.group(0)
                 
                 # Clean TIN - keep digits only
-                tin_clean = re.sub(r'[^\d]', '', tin)
+                tin_clean = _NON_DIGIT_RE.sub('', tin)
                 
                 if len(tin_clean) == 9:
                     # Format with hyphen
@@ -240,13 +290,15 @@ class PatternExtractor:
     def extract_ppg_candidates(self, text: str) -> List[ExtractionCandidate]:
         """Extract PPG candidates and combine multiple PPG IDs"""
         candidates = []
+        if not _PPG_ANCHOR_RE.search(_lowered(text)):
+            return candidates
         found_ppgs = set()  # Track unique PPG IDs
         
-        for i, pattern in enumerate(self.ppg_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(self._ppg_res):
+            matches = pattern.finditer(text)
             
             for match in matches:
-                if i == len(self.ppg_patterns) - 1:  # Special "Shared Risk" format
+                if i == len(self._ppg_res) - 1:  # Special "Shared Risk" format
                     if len(match.groups()) >= 2:
                         org = match.group(1)
                         ppg = match.group(2)
@@ -256,13 +308,12 @@ class PatternExtractor:
                     ppg = match.group(1) if match.groups() else match.group(0)
                 
                 # Clean PPG - keep alphanumeric characters
-                ppg_clean = re.sub(r'[^\dA-Za-z]', '', ppg)
+                ppg_clean = _NON_ALNUM_RE.sub('', ppg)
                 
                 # Validate PPG ID (2-6 alphanumeric characters, exclude common false positives)
                 if ppg_clean and 2 <= len(ppg_clean) <= 6:
                     # Skip obvious false positives
-                    false_positives = ['PPG', 'ID', 'TIN', 'NPI', 'MD', 'DR', 'HMO', 'PPO']
-                    if ppg_clean.upper() not in false_positives:
+                    if ppg_clean.upper() not in _PPG_FALSE_POSITIVES:
                         found_ppgs.add(ppg_clean)
                         
                         candidate = ExtractionCandidate(
@@ -279,7 +330,7 @@ class PatternExtractor:
         if len(found_ppgs) > 1:
             combined_ppg = ', '.join(sorted(found_ppgs))
             # Find the highest confidence candidate to use as template
-            best_candidate = max(candidates, key=lambda x: x.confidence) if candidates else None
+            best_candidate = max(candidates, key=_CONFIDENCE_GETTER) if candidates else None
             
             if best_candidate:
                 combined_candidate = ExtractionCandidate(
@@ -297,9 +348,11 @@ class PatternExtractor:
     def extract_phone_candidates(self, text: str) -> List[ExtractionCandidate]:
         """Extract phone number candidates with NANP validation"""
         candidates = []
+        if not _PHONE_ANCHOR_RE.search(_lowered(text)):
+            return candidates
         
-        for i, pattern in enumerate(self.phone_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(self._phone_res):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 if len(match.groups()) == 3:  # (555) 123-4567 format
@@ -308,7 +361,7 @@ class PatternExtractor:
                     phone = match.group(1) if match.groups() else match.group(0)
                 
                 # Clean phone - digits only
-                phone_clean = re.sub(r'[^\d]', '', phone)
+                phone_clean = _NON_DIGIT_RE.sub('', phone)
                 
                 if len(phone_clean) == 10:
                     # Format as XXX-XXX-XXXX
@@ -316,7 +369,7 @@ class PatternExtractor:
                     
                     candidate = ExtractionCandidate(
                         value=phone_formatted,
-                        confidence=0.9 if 'phone' in pattern.lower() else 0.7,
+                        confidence=0.9 if 'phone' in pattern.pattern.lower() else 0.7,
                         extractor_id=f"phone_pattern_{i}",
                         position=match.start(),
                         context=self._get_context(text, match.start(), 20),
@@ -329,15 +382,17 @@ class PatternExtractor:
     def extract_fax_candidates(self, text: str) -> List[ExtractionCandidate]:
         """Extract fax number candidates"""
         candidates = []
+        if not _FAX_ANCHOR_RE.search(_lowered(text)):
+            return candidates
         
-        for i, pattern in enumerate(self.fax_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(self._fax_res):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 fax = match.group(1) if match.groups() else match.group(0)
                 
                 # Clean fax - digits only
-                fax_clean = re.sub(r'[^\d]', '', fax)
+                fax_clean = _NON_DIGIT_RE.sub('', fax)
                 
                 if len(fax_clean) == 10:
                     # Format as XXX-XXX-XXXX
@@ -358,18 +413,20 @@ class PatternExtractor:
     def extract_license_candidates(self, text: str) -> List[ExtractionCandidate]:
         """Extract state license candidates"""
         candidates = []
+        if not _LICENSE_ANCHOR_RE.search(_lowered(text)):
+            return candidates
         
-        for i, pattern in enumerate(self.license_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(self._license_res):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 license_num = match.group(1) if match.groups() else match.group(0)
                 
                 # Validate format (letter followed by digits)
-                if re.match(r'^[A-Z]\d{5,6}$', license_num.upper()):
+                if _LICENSE_FORMAT_RE.match(license_num.upper()):
                     candidate = ExtractionCandidate(
                         value=license_num.upper(),
-                        confidence=0.9 if 'license' in pattern.lower() else 0.7,
+                        confidence=0.9 if 'license' in pattern.pattern.lower() else 0.7,
                         extractor_id=f"license_pattern_{i}",
                         position=match.start(),
                         context=self._get_context(text, match.start(), 20),
@@ -382,9 +439,11 @@ class PatternExtractor:
     def extract_date_candidates(self, text: str) -> List[ExtractionCandidate]:
         """Extract date candidates with multi-format parsing"""
         candidates = []
+        if not _DATE_ANCHOR_RE.search(_lowered(text)):
+            return candidates
         
-        for i, pattern in enumerate(self.date_patterns):
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for i, pattern in enumerate(self._date_res):
+            matches = pattern.finditer(text)
             
             for match in matches:
                 date_str = match.group(1) if match.groups() else match.group(0)
@@ -412,8 +471,8 @@ class PatternExtractor:
         candidates = []
         
         # First check for negation patterns
-        text_lower = text.lower()
-        has_negation = any(re.search(pattern, text_lower) for pattern in self.negation_patterns)
+        text_lower = _lowered(text)
+        has_negation = any(pattern.search(text_lower) for pattern in self._negation_res)
         
         if has_negation:
             # If negation detected, return low confidence or skip
@@ -422,12 +481,12 @@ class PatternExtractor:
         # Score each transaction type
         type_scores = {}
         
-        for trans_type, patterns in self.transaction_patterns.items():
+        for trans_type, patterns in self._transaction_res.items():
             score = 0
             positions = []
             
             for pattern in patterns:
-                matches = list(re.finditer(pattern, text, re.IGNORECASE))
+                matches = list(pattern.finditer(text))
                 score += len(matches)
                 positions.extend([match.start() for match in matches])
             
@@ -479,13 +538,8 @@ class PatternExtractor:
         date_str = date_str.strip()
         
         # Try different date formats
-        date_patterns = [
-            r'(\d{1,2})[/\-](\d{1,2})[/\-](\d{2,4})',  # MM/DD/YY or MM/DD/YYYY
-            r'(\d{4})[/\-](\d{1,2})[/\-](\d{1,2})',    # YYYY/MM/DD
-        ]
-        
-        for pattern in date_patterns:
-            match = re.match(pattern, date_str)
+        for pattern in _DATE_FORMAT_RES:
+            match = pattern.match(date_str)
             if match:
                 part1, part2, part3 = match.groups()
                 
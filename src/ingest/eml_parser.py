@@ -14,6 +14,34 @@ import logging
 from .attachments import AttachmentRouter
 
 
+# Regex patterns for thread detection, matched against the start of each stripped line
+REPLY_PATTERNS = [
+    r'^From:\s+.*',
+    r'^Sent:\s+.*',
+    r'^To:\s+.*',
+    r'^Subject:\s+.*',
+    r'-----Original Message-----',
+    r'________________________________',
+    r'On .* wrote:',
+    r'> .*' 
+]
+
+BOILERPLATE_PATTERNS = [
+    r'unsubscribe.*?(?=\n|$)',
+    r'confidential.*?(?=\n|$)',
+    r'disclaimer.*?(?=\n|$)',
+    r'this email.*?confidential.*?(?=\n|$)',
+    r'please.*?unsubscribe.*?(?=\n|$)'
+]
+
+# Compiled once at import so every parser in a worker process shares them
+_REPLY_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in REPLY_PATTERNS), re.IGNORECASE)
+_BOILERPLATE_RES = [re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in BOILERPLATE_PATTERNS]
+_NEWLINE_RE = re.compile(r'\r\n?')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_NPI_RE = re.compile(r'NPI[:\s]*(\d{10})', re.IGNORECASE)
+
+
 class ParsedContent:
     """Container for parsed email content"""
     
@@ -33,25 +61,8 @@ class EMLParser:
         self.attachment_router = AttachmentRouter()
         self.logger = logging.getLogger(__name__)
         
-        # Regex patterns for thread detection
-        self.reply_patterns = [
-            r'^From:\s+.*',
-            r'^Sent:\s+.*',
-            r'^To:\s+.*',
-            r'^Subject:\s+.*',
-            r'-----Original Message-----',
-            r'________________________________',
-            r'On .* wrote:',
-            r'> .*' 
-        ]
-        
-        self.boilerplate_patterns = [
-            r'unsubscribe.*?(?=\n|$)',
-            r'confidential.*?(?=\n|$)',
-            r'disclaimer.*?(?=\n|$)',
-            r'this email.*?confidential.*?(?=\n|$)',
-            r'please.*?unsubscribe.*?(?=\n|$)'
-        ]
+        self.reply_patterns = REPLY_PATTERNS
+        self.boilerplate_patterns = BOILERPLATE_PATTERNS
     
     def parse_eml(self, eml_path: Path) -> ParsedContent:
         """Main parsing entry point"""
@@ -59,6 +70,8 @@ class EMLParser:
         content.source_file = eml_path
         
         try:
+            # BytesParser.parse feeds the file to the parser in chunks, so the raw
+            # bytes are never held in memory alongside the parsed message
             with open(eml_path, 'rb') as f:
                 msg = BytesParser(policy=policy.default).parse(f)
             
@@ -101,20 +114,27 @@ class EMLParser:
         html_content = ""
         
         if msg.is_multipart():
+            # Collect decoded parts and join once rather than growing a string per part
+            text_parts = []
+            html_parts = []
+            
             for part in msg.walk():
                 content_type = part.get_content_type()
                 
                 if content_type == "text/plain":
                     try:
-                        text_content += part.get_content()
+                        text_parts.append(part.get_content())
                     except Exception as e:
                         self.logger.warning(f"Could not decode text part: {e}")
                 
                 elif content_type == "text/html":
                     try:
-                        html_content += part.get_content()
+                        html_parts.append(part.get_content())
                     except Exception as e:
                         self.logger.warning(f"Could not decode HTML part: {e}")
+            
+            text_content = "".join(text_parts)
+            html_content = "".join(html_parts)
         
         else:
             # Single part message
@@ -177,9 +197,9 @@ class EMLParser:
     
     def _clean_whitespace(self, text: str) -> str:
         """Clean whitespace while preserving meaningful structure"""
-        text = re.sub(r'\r\n?', '\n', text)
+        text = _NEWLINE_RE.sub('\n', text)
         
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
         
         lines = []
         for line in text.split('\n'):
@@ -220,11 +240,8 @@ class EMLParser:
         
         reply_start = None
         for i, line in enumerate(lines):
-            for pattern in self.reply_patterns:
-                if re.match(pattern, line.strip(), re.IGNORECASE):
-                    reply_start = i
-                    break
-            if reply_start is not None:
+            if _REPLY_RE.match(line.strip()):
+                reply_start = i
                 break
         
         if reply_start is None:
@@ -240,10 +257,8 @@ class EMLParser:
     
     def _has_unique_provider_blocks(self, older_content: str, newer_content: str) -> bool:
         """Check if older content has unique NPIs not in newer content"""
-        npi_pattern = r'NPI[:\s]*(\d{10})'
-        
-        older_npis = set(re.findall(npi_pattern, older_content, re.IGNORECASE))
-        newer_npis = set(re.findall(npi_pattern, newer_content, re.IGNORECASE))
+        older_npis = set(_NPI_RE.findall(older_content))
+        newer_npis = set(_NPI_RE.findall(newer_content))
         
         return len(older_npis - newer_npis) > 0
     
@@ -252,7 +267,7 @@ class EMLParser:
         Strip common boilerplate patterns
         Called after extraction to avoid losing signal during parsing
         """
-        for pattern in self.boilerplate_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
+        for pattern in _BOILERPLATE_RES:
+            text = pattern.sub('', text)
         
         return text
\ No newline at end of file
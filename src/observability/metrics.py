@@ -9,6 +9,13 @@ from collections import defaultdict, Counter
 import json
 import logging
 
+from ..text_utils import digits_only
+
+
+def _count_digits(value: str) -> int:
+    """Count digit characters in a field value"""
+    return len(digits_only(value))
+
 
 @dataclass
 class ProcessingMetrics:
@@ -81,14 +88,37 @@ class MetricsCollector:
         Record field-level success rates
         Determines success based on whether field has actual value vs "Information not found"
         """
+        self.merge_field_success_summary(self.summarize_field_success(extracted_data))
+    
+    def summarize_field_success(self, extracted_data: List[Dict[str, str]]) -> Dict[str, Dict[str, int]]:
+        """
+        Count per-field successes for a set of records without recording them
+        Lets batch workers send a small summary instead of the records themselves
+        """
+        summary = {field: {"success": 0, "total": 0} for field in self.tracked_fields}
+        is_valid_field_value = self._is_valid_field_value
+        
         for record in extracted_data:
+            record_get = record.get
             for field in self.tracked_fields:
-                self.metrics.field_success_rates[field]["total"] += 1
+                stats = summary[field]
+                stats["total"] += 1
                 
-                if field in record and record[field] != "Information not found":
+                value = record_get(field)
+                if value is not None and value != "Information not found":
                     # Additional validation for some fields
-                    if self._is_valid_field_value(field, record[field]):
-                        self.metrics.field_success_rates[field]["success"] += 1
+                    if is_valid_field_value(field, value):
+                        stats["success"] += 1
+        
+        return summary
+    
+    def merge_field_success_summary(self, summary: Dict[str, Dict[str, int]]):
+        """Add counters produced by summarize_field_success"""
+        for field, stats in summary.items():
+            if stats["total"]:
+                field_stats = self.metrics.field_success_rates[field]
+                field_stats["success"] += stats["success"]
+                field_stats["total"] += stats["total"]
     
     def record_extractor_performance(self, field_results: Dict[str, Any]):
         """Record which extractors are most successful"""
@@ -304,11 +334,11 @@ class MetricsCollector:
         
         # Field-specific validation
         if "NPI" in field:
-            return len(''.join(filter(str.isdigit, value))) == 10
+            return _count_digits(value) == 10
         elif field == "TIN":
-            return len(''.join(filter(str.isdigit, value))) == 9
+            return _count_digits(value) == 9
         elif "Phone" in field or "Fax" in field:
-            return len(''.join(filter(str.isdigit, value))) >= 10
+            return _count_digits(value) >= 10
         elif "Date" in field:
             return "/" in value or "-" in value
         
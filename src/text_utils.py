@@ -0,0 +1,12 @@
+"""
+Small string helpers shared across packages
+"""
+
+# Translate table covers Latin-1; rarer characters fall back to the per-character filter
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(256) if not chr(c).isdigit()))
+
+
+def digits_only(value: str) -> str:
+    """Strip every non-digit character"""
+    digits = value.translate(_NON_DIGITS)
+    return digits if digits.isascii() else ''.join(filter(str.isdigit, digits))